@@ -1,54 +1,121 @@
 """Alembic environment configuration for async SQLAlchemy migrations."""
 
 import asyncio
+import functools
+import os
+import pickle
 from logging.config import fileConfig
+from pathlib import Path
+from typing import Optional
 
 from alembic import context
-from sqlalchemy import pool, text
+from sqlalchemy import MetaData
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.config import get_settings
-from app.database.base import Base
-from app.models import (
-    AlertAcknowledgment,
-    GeofencedZone,
-    RiskAlert,
-    SystemConfig,
-    Vessel,
-    VesselPosition,
-)
 
 # Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Read-only commands print their own output and need no logging setup
+_QUIET_COMMANDS = frozenset({"current", "heads", "history", "show"})
+
+
+def _command_name() -> Optional[str]:
+    """Get the alembic CLI command being run, if invoked from the CLI."""
+    cmd = getattr(config.cmd_opts, "cmd", None)
+    return cmd[0].__name__ if cmd else None
+
+
+# Interpret the config file for Python logging. ALEMBIC_LOG_CONFIG=0 skips it.
+if (
+    config.config_file_name is not None
+    and os.environ.get("ALEMBIC_LOG_CONFIG", "1") == "1"
+    and not context.is_offline_mode()
+    and _command_name() not in _QUIET_COMMANDS
+):
     fileConfig(config.config_file_name)
 
+# Pickled model metadata, used only when ALEMBIC_META_CACHE is set (e.g. in
+# CI, where alembic runs many times against unchanged models)
+_META_CACHE = Path(".alembic_meta.pkl")
+_APP_DIR = Path(__file__).resolve().parent.parent / "app"
+_MODEL_SOURCES = (_APP_DIR / "database" / "base.py", *(_APP_DIR / "models").glob("*.py"))
+
+
+def _meta_cache_is_fresh() -> bool:
+    """Check that the metadata cache is newer than every model source."""
+    if not _META_CACHE.is_file():
+        return False
+    cache_mtime = _META_CACHE.stat().st_mtime
+    return all(path.stat().st_mtime < cache_mtime for path in _MODEL_SOURCES)
+
+
+def load_target_metadata() -> MetaData:
+    """Load model metadata, from the pickle cache when enabled and fresh."""
+    use_cache = bool(os.environ.get("ALEMBIC_META_CACHE"))
+    if use_cache and _meta_cache_is_fresh():
+        with _META_CACHE.open("rb") as f:
+            return pickle.load(f)
+
+    from app.database.base import Base
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+
+    if use_cache:
+        with _META_CACHE.open("wb") as f:
+            pickle.dump(Base.metadata, f)
+    return Base.metadata
+
+
 # Model metadata for autogenerate
-target_metadata = Base.metadata
+target_metadata = load_target_metadata()
 
 # Get settings
 settings = get_settings()
 
+# Schemas managed by these migrations
+MIGRATION_SCHEMAS = frozenset({"ais", "security"})
 
-def get_url() -> str:
-    """Get async database URL."""
-    url = settings.database_url
+# Schemas must exist before alembic can create its version table in them
+SCHEMA_BOOTSTRAP_SQL = " ".join(
+    f"CREATE SCHEMA IF NOT EXISTS {schema};" for schema in sorted(MIGRATION_SCHEMAS)
+)
+
+# Serializes concurrent `alembic upgrade` runs (e.g. several replicas
+# starting at once) so they cannot race on security.alembic_version. The
+# lock is session-level: migrations that use autocommit_block() (e.g. for
+# CREATE INDEX CONCURRENTLY) commit mid-run, which would release a
+# transaction-level lock
+MIGRATION_LOCK_SQL = "SELECT pg_advisory_lock(hashtext('alembic_poseidon'))"
+MIGRATION_UNLOCK_SQL = "SELECT pg_advisory_unlock(hashtext('alembic_poseidon'))"
+
+
+def _async_url(url: str) -> str:
+    """Rewrite a plain PostgreSQL URL to use the asyncpg driver."""
     if url.startswith("postgresql://"):
         return url.replace("postgresql://", "postgresql+asyncpg://", 1)
     return url
 
 
+# Async database URL, resolved once at import
+_DB_URL = _async_url(settings.database_url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _include(type_: str, schema: Optional[str]) -> bool:
+    """Decide inclusion from object type and schema alone."""
+    if type_ == "table":
+        return schema in MIGRATION_SCHEMAS
+    return True
+
+
 def include_object(object, name, type_, reflected, compare_to):
     """Filter objects for autogenerate.
 
     Include only objects in 'ais' and 'security' schemas.
     """
-    if type_ == "table":
-        return object.schema in ("ais", "security")
-    return True
+    return _include(type_, getattr(object, "schema", None))
 
 
 def run_migrations_offline() -> None:
@@ -57,9 +124,8 @@ def run_migrations_offline() -> None:
     This configures the context with just a URL and not an Engine.
     Calls to context.execute() emit the SQL to the script output.
     """
-    url = get_url()
     context.configure(
-        url=url,
+        url=_DB_URL,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -81,29 +147,47 @@ def do_run_migrations(connection: Connection) -> None:
         include_object=include_object,
         version_table_schema="security",
         compare_type=True,
-        compare_server_default=True,
+        # Server-default comparison is slow and noisy; opt in when needed
+        compare_server_default=bool(os.environ.get("ALEMBIC_COMPARE_DEFAULTS")),
     )
 
-    with context.begin_transaction():
-        context.run_migrations()
+    connection.exec_driver_sql(MIGRATION_LOCK_SQL)
+    # Skip the WAL flush wait for this session, so it also covers the
+    # transactions that follow an autocommit block; a crash before commit
+    # still rolls the migration back
+    connection.exec_driver_sql("SET synchronous_commit = off")
+    # End the implicit transaction; the lock and setting outlive it
+    connection.commit()
+    try:
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        connection.exec_driver_sql(MIGRATION_UNLOCK_SQL)
+        connection.commit()
 
 
 async def run_async_migrations() -> None:
     """Run migrations in async mode."""
     configuration = config.get_section(config.config_ini_section, {})
-    configuration["sqlalchemy.url"] = get_url()
+    configuration["sqlalchemy.url"] = _DB_URL
 
+    # Migrations run on a single connection. JIT is disabled for the session:
+    # DDL and catalog queries never benefit from it but can pay its startup.
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_recycle=-1,
+        connect_args={"server_settings": {"jit": "off"}},
     )
 
     async with connectable.connect() as connection:
-        # Create schemas if they don't exist
-        await connection.execute(text("CREATE SCHEMA IF NOT EXISTS ais"))
-        await connection.execute(text("CREATE SCHEMA IF NOT EXISTS security"))
-        await connection.commit()
+        # Create schemas if they don't exist. Issued on the underlying asyncpg
+        # connection so both statements go out as a single simple-query
+        # round-trip (prepared statements cannot hold multiple commands).
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.execute(SCHEMA_BOOTSTRAP_SQL)
 
         await connection.run_sync(do_run_migrations)
 
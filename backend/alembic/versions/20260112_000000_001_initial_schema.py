@@ -19,6 +19,17 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _create_indexes(*statements: str) -> None:
+    """Create several indexes in a single round-trip.
+
+    The statements are wrapped in one DO block: asyncpg prepares every
+    statement it executes, and a prepared statement cannot hold more than
+    one command.
+    """
+    body = " ".join(f"{statement};" for statement in statements)
+    op.execute(f"DO $$ BEGIN {body} END $$")
+
+
 def upgrade() -> None:
     # Create schemas
     op.execute("CREATE SCHEMA IF NOT EXISTS ais")
@@ -33,7 +44,7 @@ def upgrade() -> None:
     # Create vessels table
     op.create_table(
         "vessels",
-        sa.Column("mmsi", sa.String(length=9), nullable=False),
+        sa.Column("mmsi", sa.Integer(), autoincrement=False, nullable=False),
         sa.Column("imo", sa.String(length=10), nullable=True),
         sa.Column("name", sa.String(length=255), nullable=True),
         sa.Column("call_sign", sa.String(length=50), nullable=True),
@@ -47,85 +58,90 @@ def upgrade() -> None:
         sa.Column("width", sa.Integer(), nullable=True),
         sa.Column("draught", sa.Numeric(precision=4, scale=1), nullable=True),
         sa.Column("destination", sa.String(length=255), nullable=True),
-        sa.Column("eta", sa.DateTime(), nullable=True),
+        sa.Column("eta", sa.DateTime(timezone=True), nullable=True),
         sa.Column("flag_state", sa.String(length=2), nullable=True),
         sa.Column("risk_score", sa.Numeric(precision=5, scale=2), nullable=True),
         sa.Column("risk_category", sa.String(length=20), nullable=True),
-        sa.Column("last_latitude", sa.Numeric(precision=9, scale=6), nullable=True),
-        sa.Column("last_longitude", sa.Numeric(precision=10, scale=6), nullable=True),
+        sa.Column("last_latitude", sa.Float(precision=53), nullable=True),
+        sa.Column("last_longitude", sa.Float(precision=53), nullable=True),
         sa.Column("last_speed", sa.Numeric(precision=5, scale=2), nullable=True),
         sa.Column("last_course", sa.Numeric(precision=5, scale=2), nullable=True),
-        sa.Column("last_position_time", sa.DateTime(), nullable=True),
+        sa.Column("last_position_time", sa.DateTime(timezone=True), nullable=True),
         sa.Column(
             "created_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
         sa.Column(
             "updated_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
+        sa.CheckConstraint(
+            "mmsi BETWEEN 100000000 AND 999999999",
+            name=op.f("ck_vessels_mmsi_range"),
+        ),
         sa.PrimaryKeyConstraint("mmsi", name=op.f("pk_vessels")),
         schema="ais",
     )
-    op.create_index("ix_vessels_name", "vessels", ["name"], schema="ais")
-    op.create_index("ix_vessels_ship_type", "vessels", ["ship_type"], schema="ais")
-    op.create_index("ix_vessels_flag_state", "vessels", ["flag_state"], schema="ais")
-    op.create_index("ix_vessels_risk_score", "vessels", ["risk_score"], schema="ais")
+    _create_indexes(
+        # Trigram GIN serves substring (ILIKE) name searches
+        "CREATE INDEX ix_vessels_name_trgm ON ais.vessels "
+        "USING GIN (name gin_trgm_ops)",
+        "CREATE INDEX ix_vessels_ship_type ON ais.vessels (ship_type)",
+        "CREATE INDEX ix_vessels_flag_state ON ais.vessels (flag_state)",
+        "CREATE INDEX ix_vessels_risk_score ON ais.vessels (risk_score)",
+    )
 
-    # Create vessel_positions table
-    op.create_table(
-        "vessel_positions",
-        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
-        sa.Column("mmsi", sa.String(length=9), nullable=False),
-        sa.Column("timestamp", sa.DateTime(), nullable=False),
-        sa.Column(
-            "position",
-            geoalchemy2.types.Geography(
-                geometry_type="POINT",
-                srid=4326,
-                from_text="ST_GeogFromText",
-                name="geography",
-            ),
-            nullable=False,
-        ),
-        sa.Column("latitude", sa.Numeric(precision=9, scale=6), nullable=False),
-        sa.Column("longitude", sa.Numeric(precision=10, scale=6), nullable=False),
-        sa.Column("speed", sa.Numeric(precision=5, scale=2), nullable=True),
-        sa.Column("course", sa.Numeric(precision=5, scale=2), nullable=True),
-        sa.Column("heading", sa.Integer(), nullable=True),
-        sa.Column("navigation_status", sa.Integer(), nullable=True),
-        sa.Column("rate_of_turn", sa.Integer(), nullable=True),
-        sa.Column("position_accuracy", sa.Integer(), nullable=True),
-        sa.Column(
-            "received_at",
-            sa.DateTime(),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.ForeignKeyConstraint(
-            ["mmsi"],
-            ["ais.vessels.mmsi"],
-            name=op.f("fk_vessel_positions_mmsi_vessels"),
-            ondelete="CASCADE",
-        ),
-        sa.PrimaryKeyConstraint("id", name=op.f("pk_vessel_positions")),
-        schema="ais",
+    # Create vessel_positions table, range-partitioned by month on timestamp.
+    # The partition key has to be part of the primary key.
+    op.execute(
+        """
+        CREATE TABLE ais.vessel_positions (
+            id BIGSERIAL NOT NULL,
+            mmsi INTEGER NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            position geometry(POINT, 4326) NOT NULL,
+            speed NUMERIC(5, 2),
+            course NUMERIC(5, 2),
+            heading INTEGER,
+            navigation_status INTEGER,
+            rate_of_turn INTEGER,
+            position_accuracy INTEGER,
+            received_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            CONSTRAINT pk_vessel_positions PRIMARY KEY (id, timestamp),
+            CONSTRAINT fk_vessel_positions_mmsi_vessels FOREIGN KEY (mmsi)
+                REFERENCES ais.vessels (mmsi) ON DELETE CASCADE
+        ) PARTITION BY RANGE (timestamp)
+        """
     )
-    op.create_index(
-        "ix_vessel_positions_mmsi_timestamp",
-        "vessel_positions",
-        ["mmsi", "timestamp"],
-        schema="ais",
+    for month in range(1, 13):
+        start = f"2026-{month:02d}-01"
+        end = "2027-01-01" if month == 12 else f"2026-{month + 1:02d}-01"
+        op.execute(
+            f"CREATE TABLE ais.vessel_positions_y2026m{month:02d} "
+            f"PARTITION OF ais.vessel_positions "
+            f"FOR VALUES FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')"
+        )
+    # Catch-all so inserts outside the pre-created months never fail
+    op.execute(
+        "CREATE TABLE ais.vessel_positions_default "
+        "PARTITION OF ais.vessel_positions DEFAULT"
     )
-    op.create_index(
-        "ix_vessel_positions_timestamp",
-        "vessel_positions",
-        ["timestamp"],
-        schema="ais",
+
+    # Indexes are declared on the parent and created on every partition
+    # The track index covers "latest positions for a vessel" index-only.
+    # BRIN suits append-only telemetry ordered by time: min/max per page range
+    # instead of one B-tree entry per row.
+    _create_indexes(
+        "CREATE INDEX ix_vessel_positions_mmsi_timestamp "
+        "ON ais.vessel_positions (mmsi, timestamp DESC) "
+        "INCLUDE (position, speed, course)",
+        "CREATE INDEX ix_vessel_positions_timestamp "
+        "ON ais.vessel_positions USING BRIN (timestamp) "
+        "WITH (pages_per_range = 64)",
     )
     op.create_index(
         "ix_vessel_positions_position",
@@ -151,11 +167,12 @@ def upgrade() -> None:
         sa.Column("security_level", sa.Integer(), nullable=False),
         sa.Column(
             "geometry",
-            geoalchemy2.types.Geography(
+            geoalchemy2.types.Geometry(
                 geometry_type="POLYGON",
                 srid=4326,
-                from_text="ST_GeogFromText",
-                name="geography",
+                spatial_index=False,
+                from_text="ST_GeomFromEWKT",
+                name="geometry",
             ),
             nullable=False,
         ),
@@ -171,13 +188,13 @@ def upgrade() -> None:
         sa.Column("fill_opacity", sa.Float(), nullable=True),
         sa.Column(
             "created_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
         sa.Column(
             "updated_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
@@ -192,11 +209,13 @@ def upgrade() -> None:
         schema="security",
         postgresql_using="gist",
     )
-    op.create_index("ix_zones_zone_type", "zones", ["zone_type"], schema="security")
-    op.create_index(
-        "ix_zones_security_level", "zones", ["security_level"], schema="security"
+    _create_indexes(
+        "CREATE INDEX ix_zones_zone_type ON security.zones (zone_type)",
+        "CREATE INDEX ix_zones_security_level ON security.zones (security_level)",
+        "CREATE INDEX ix_zones_active ON security.zones (active)",
+        "CREATE INDEX ix_zones_alert_config_gin ON security.zones "
+        "USING GIN (alert_config jsonb_path_ops)",
     )
-    op.create_index("ix_zones_active", "zones", ["active"], schema="security")
 
     # Create alerts table
     op.create_table(
@@ -212,44 +231,43 @@ def upgrade() -> None:
         sa.Column("status", sa.String(length=20), nullable=False),
         sa.Column("title", sa.String(length=255), nullable=False),
         sa.Column("message", sa.Text(), nullable=False),
-        sa.Column("vessel_mmsi", sa.String(length=9), nullable=True),
-        sa.Column("secondary_vessel_mmsi", sa.String(length=9), nullable=True),
+        sa.Column("vessel_mmsi", sa.Integer(), nullable=True),
+        sa.Column("secondary_vessel_mmsi", sa.Integer(), nullable=True),
         sa.Column("zone_id", postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column(
             "position",
-            geoalchemy2.types.Geography(
+            geoalchemy2.types.Geometry(
                 geometry_type="POINT",
                 srid=4326,
-                from_text="ST_GeogFromText",
-                name="geography",
+                spatial_index=False,
+                from_text="ST_GeomFromEWKT",
+                name="geometry",
             ),
             nullable=True,
         ),
-        sa.Column("latitude", sa.Numeric(precision=9, scale=6), nullable=True),
-        sa.Column("longitude", sa.Numeric(precision=10, scale=6), nullable=True),
         sa.Column("details", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column("risk_score", sa.Numeric(precision=5, scale=2), nullable=True),
         sa.Column("acknowledged", sa.Boolean(), nullable=False),
-        sa.Column("acknowledged_at", sa.DateTime(), nullable=True),
+        sa.Column("acknowledged_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("acknowledged_by", sa.String(length=255), nullable=True),
         sa.Column("acknowledgment_notes", sa.Text(), nullable=True),
         sa.Column("resolved", sa.Boolean(), nullable=False),
-        sa.Column("resolved_at", sa.DateTime(), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("resolved_by", sa.String(length=255), nullable=True),
         sa.Column("resolution_notes", sa.Text(), nullable=True),
         sa.Column(
             "created_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
         sa.Column(
             "updated_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
-        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
         sa.ForeignKeyConstraint(
             ["vessel_mmsi"],
             ["ais.vessels.mmsi"],
@@ -271,16 +289,15 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id", name=op.f("pk_alerts")),
         schema="security",
     )
-    op.create_index(
-        "ix_alerts_alert_type", "alerts", ["alert_type"], schema="security"
-    )
-    op.create_index("ix_alerts_severity", "alerts", ["severity"], schema="security")
-    op.create_index("ix_alerts_status", "alerts", ["status"], schema="security")
-    op.create_index(
-        "ix_alerts_vessel_mmsi", "alerts", ["vessel_mmsi"], schema="security"
-    )
-    op.create_index(
-        "ix_alerts_created_at", "alerts", ["created_at"], schema="security"
+    _create_indexes(
+        "CREATE INDEX ix_alerts_alert_type ON security.alerts (alert_type)",
+        "CREATE INDEX ix_alerts_severity ON security.alerts (severity)",
+        "CREATE INDEX ix_alerts_status ON security.alerts (status)",
+        "CREATE INDEX ix_alerts_vessel_mmsi ON security.alerts (vessel_mmsi)",
+        "CREATE INDEX ix_alerts_created_at ON security.alerts (created_at)",
+        # jsonb_path_ops GIN serves @> containment filters on alert details
+        "CREATE INDEX ix_alerts_details_gin ON security.alerts "
+        "USING GIN (details jsonb_path_ops)",
     )
     op.create_index(
         "ix_alerts_position",
@@ -310,7 +327,7 @@ def upgrade() -> None:
         sa.Column("action_metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column(
             "created_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
@@ -323,29 +340,15 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id", name=op.f("pk_alert_acknowledgments")),
         schema="security",
     )
-    op.create_index(
-        "ix_alert_acks_alert_id",
-        "alert_acknowledgments",
-        ["alert_id"],
-        schema="security",
-    )
-    op.create_index(
-        "ix_alert_acks_user_id",
-        "alert_acknowledgments",
-        ["user_id"],
-        schema="security",
-    )
-    op.create_index(
-        "ix_alert_acks_action",
-        "alert_acknowledgments",
-        ["action"],
-        schema="security",
-    )
-    op.create_index(
-        "ix_alert_acks_created_at",
-        "alert_acknowledgments",
-        ["created_at"],
-        schema="security",
+    _create_indexes(
+        "CREATE INDEX ix_alert_acks_alert_id "
+        "ON security.alert_acknowledgments (alert_id)",
+        "CREATE INDEX ix_alert_acks_user_id "
+        "ON security.alert_acknowledgments (user_id)",
+        "CREATE INDEX ix_alert_acks_action "
+        "ON security.alert_acknowledgments (action)",
+        "CREATE INDEX ix_alert_acks_created_at "
+        "ON security.alert_acknowledgments (created_at)",
     )
 
     # Create system_config table
@@ -375,13 +378,13 @@ def upgrade() -> None:
         sa.Column("modified_by", sa.String(length=255), nullable=True),
         sa.Column(
             "created_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
         sa.Column(
             "updated_at",
-            sa.DateTime(),
+            sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=False,
         ),
@@ -389,21 +392,13 @@ def upgrade() -> None:
         sa.UniqueConstraint("key", name=op.f("uq_system_config_key")),
         schema="security",
     )
-    op.create_index(
-        "ix_system_config_key",
-        "system_config",
-        ["key"],
-        unique=True,
-        schema="security",
-    )
-    op.create_index(
-        "ix_system_config_category",
-        "system_config",
-        ["category"],
-        schema="security",
-    )
-    op.create_index(
-        "ix_system_config_active", "system_config", ["active"], schema="security"
+    _create_indexes(
+        "CREATE UNIQUE INDEX ix_system_config_key ON security.system_config (key)",
+        "CREATE INDEX ix_system_config_category "
+        "ON security.system_config (category)",
+        "CREATE INDEX ix_system_config_active ON security.system_config (active)",
+        "CREATE INDEX ix_system_config_value_gin ON security.system_config "
+        "USING GIN (value jsonb_path_ops)",
     )
 
 
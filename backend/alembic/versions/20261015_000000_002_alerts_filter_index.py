@@ -0,0 +1,61 @@
+"""Composite index for the alert list filter
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# DO block, since DROP INDEX CONCURRENTLY cannot run inside a function; a
+# plain DROP INDEX is fine for an invalid index, which no query uses
+_DROP_INVALID_INDEX_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_index i
+        WHERE i.indexrelid = to_regclass('security.ix_alerts_created_status_severity_type')
+          AND NOT i.indisvalid
+    ) THEN
+        DROP INDEX security.ix_alerts_created_status_severity_type;
+    END IF;
+END $$
+"""
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # A failed CONCURRENTLY build leaves an INVALID index behind that
+        # IF NOT EXISTS would skip; drop it so a retry rebuilds it
+        op.execute(_DROP_INVALID_INDEX_SQL)
+        # GET /alerts filters on a created_at window plus optional status,
+        # severity and type, newest first. Leading with created_at DESC gives
+        # the order without a sort; the other keys are checked in the index
+        # before any heap fetch
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_created_status_severity_type "
+            "ON security.alerts (created_at DESC, status, severity, alert_type)"
+        )
+        # Same leading column, so the single-column index is redundant
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS security.ix_alerts_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_created_at "
+            "ON security.alerts (created_at)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS security.ix_alerts_created_status_severity_type"
+        )
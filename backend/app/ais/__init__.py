@@ -30,6 +30,7 @@ from app.ais.config import (
     create_adapters_from_config,
     create_default_adapter,
     load_config,
+    load_config_async,
 )
 
 __all__ = [
@@ -52,4 +53,5 @@ __all__ = [
     "create_adapters_from_config",
     "create_default_adapter",
     "load_config",
+    "load_config_async",
 ]
@@ -0,0 +1,184 @@
+"""Array kernel for the collision detection pair sweep.
+
+Evaluates CPA/TCPA with the same flat-earth relative-velocity model as
+calculate_cpa_tcpa(). Candidate pairs come from a sweep over latitude:
+two vessels further apart than they could close within the TCPA window
+are never evaluated, so the work scales with traffic density instead of
+with N x N.
+"""
+
+import numpy as np
+
+# Sorted vessels whose candidate pairs are generated per block
+BLOCK_ROWS = 256
+
+
+def search_radius_nm(max_speed: float, cpa_thr: float, tcpa_thr: float) -> float:
+    """Largest current separation that can still produce a reportable risk.
+
+    A pair is reported only if CPA < 2 * cpa_thr within tcpa_thr minutes, and
+    two vessels can close at most 2 * max_speed knots.
+
+    Args:
+        max_speed: Highest speed in the fleet (knots)
+        cpa_thr: CPA threshold in nautical miles
+        tcpa_thr: TCPA window in minutes
+
+    Returns:
+        Search radius in nautical miles
+    """
+    return 2 * max_speed * (tcpa_thr / 60) + 2 * cpa_thr
+
+
+def _candidate_pairs(
+    lat_sorted: np.ndarray,
+    window_deg: float,
+    start: int,
+    stop: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pairs (i, j), i < j, of sorted rows whose latitudes are within window_deg.
+
+    Only rows start..stop-1 are used as the first element of a pair.
+    """
+    rows = np.arange(start, stop)
+    upper = np.searchsorted(lat_sorted, lat_sorted[start:stop] + window_deg, side="right")
+    counts = upper - rows - 1
+    i = np.repeat(rows, counts)
+    # Offset of each pair within its row's run of candidates
+    offsets = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return i, i + 1 + offsets
+
+
+def warm_up() -> None:
+    """Run the kernel once on a tiny synthetic fleet.
+
+    Called when a long-lived worker process starts so that importing NumPy
+    and the first-call setup are not paid by the first detection cycle.
+    """
+    lat = np.array([40.60, 40.61])
+    lon = np.array([22.90, 22.90])
+    speed = np.array([10.0, 10.0])
+    vx = np.zeros(2)
+    vy = np.array([10.0, -10.0])
+    _, _, cpa, tcpa, _ = scan_pairs(lat, lon, speed, vx, vy, 0.5, 30.0, 0.5)
+    classify_pairs(cpa, tcpa, 0.5)
+
+
+def classify_pairs(cpa: np.ndarray, tcpa: np.ndarray, cpa_thr: float) -> np.ndarray:
+    """Classify pairs into risk levels without per-pair branching.
+
+    Uses the same bands as classify_risk_level().
+
+    Args:
+        cpa: CPA per pair in nautical miles
+        tcpa: TCPA per pair in minutes
+        cpa_thr: CPA threshold in nautical miles
+
+    Returns:
+        Level per pair: 0 critical, 1 high, 2 medium, 3 low, 4 no risk
+    """
+    return np.select(
+        [
+            (cpa < cpa_thr * 0.5) & (tcpa < 10),
+            (cpa < cpa_thr) & (tcpa < 15),
+            (cpa < cpa_thr * 1.5) & (tcpa < 20),
+            cpa < cpa_thr * 2,
+        ],
+        [0, 1, 2, 3],
+        default=4,
+    )
+
+
+def scan_pairs(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    speed: np.ndarray,
+    vx: np.ndarray,
+    vy: np.ndarray,
+    cpa_thr: float,
+    tcpa_thr: float,
+    min_speed: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find vessel pairs that may be on a collision course.
+
+    A pair survives when both vessels move at least min_speed, the relative
+    velocity is non-negligible, 0 <= TCPA <= tcpa_thr and CPA is below the
+    widest risk band (2 * cpa_thr).
+
+    Args:
+        lat, lon: Positions in degrees, shape (N,)
+        speed: Speed over ground in knots, shape (N,)
+        vx, vy: Velocity components in knots (x = East, y = North), shape (N,)
+        cpa_thr: CPA threshold in nautical miles
+        tcpa_thr: TCPA window in minutes
+        min_speed: Minimum speed for a vessel to be considered moving
+
+    Returns:
+        (i_idx, j_idx, cpa, tcpa, dist) for surviving pairs with i < j;
+        CPA and distance in nautical miles, TCPA in minutes
+    """
+    # One cosine per vessel; the mean of a pair's cosines matches the cosine
+    # of its mean latitude to O(dlat^2), so pairs need no trig of their own
+    cos_lat = np.cos(np.radians(lat))
+
+    # Stationary vessels never form a pair, so leave them out of the sweep
+    keep = np.flatnonzero(speed >= min_speed)
+    order = keep[np.argsort(lat[keep], kind="stable")]
+    lat_sorted = lat[order]
+
+    found: list[tuple[np.ndarray, ...]] = []
+    if len(order) >= 2:
+        # Flat-earth dy is 60 nm per degree, so a separation beyond the search
+        # radius in latitude alone already rules the pair out
+        window_deg = search_radius_nm(float(speed[order].max()), cpa_thr, tcpa_thr) / 60.0
+
+        for start in range(0, len(order) - 1, BLOCK_ROWS):
+            si, sj = _candidate_pairs(
+                lat_sorted, window_deg, start, min(start + BLOCK_ROWS, len(order))
+            )
+            if not len(si):
+                continue
+
+            # Back to caller indices, keeping i < j as in the input order
+            i = np.minimum(order[si], order[sj])
+            j = np.maximum(order[si], order[sj])
+
+            dx = (lon[j] - lon[i]) * 30.0 * (cos_lat[i] + cos_lat[j])
+            dy = (lat[j] - lat[i]) * 60.0
+
+            # Box test against the pair's own closing bound before the
+            # velocity math. Chebyshev distance never exceeds the Euclidean
+            # one, so this cannot drop a reportable pair
+            near = np.maximum(np.abs(dx), np.abs(dy)) <= (
+                (speed[i] + speed[j]) * (tcpa_thr / 60) + 2 * cpa_thr
+            )
+            if not near.any():
+                continue
+            i, j, dx, dy = i[near], j[near], dx[near], dy[near]
+
+            dvx = vx[j] - vx[i]
+            dvy = vy[j] - vy[i]
+            dv_squared = dvx * dvx + dvy * dvy
+
+            tcpa_hours = -(dx * dvx + dy * dvy) / np.maximum(dv_squared, 1e-6)
+            tcpa = tcpa_hours * 60
+            cpa = np.hypot(dx + dvx * tcpa_hours, dy + dvy * tcpa_hours)
+
+            mask = (
+                (dv_squared >= 0.0001)
+                & (tcpa >= 0)
+                & (tcpa <= tcpa_thr)
+                & (cpa < cpa_thr * 2)
+            )
+            if mask.any():
+                found.append(
+                    (i[mask], j[mask], cpa[mask], tcpa[mask], np.hypot(dx[mask], dy[mask]))
+                )
+
+    if not found:
+        empty_idx = np.empty(0, dtype=np.int32)
+        empty = np.empty(0, dtype=np.float64)
+        return empty_idx, empty_idx, empty, empty, empty
+
+    i_idx, j_idx, cpa, tcpa, dist = (np.concatenate(parts) for parts in zip(*found))
+    return i_idx.astype(np.int32), j_idx.astype(np.int32), cpa, tcpa, dist
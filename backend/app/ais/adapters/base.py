@@ -4,15 +4,20 @@ Defines the interface that all AIS data sources must implement.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from app.ais.models import AISMessage, BoundingBox
 
 logger = logging.getLogger(__name__)
 
+# Number of recent fetch latencies averaged into SourceInfo
+LATENCY_SAMPLE_SIZE = 100
+
 
 class AISDataFetchError(Exception):
     """Exception raised when fetching AIS data fails."""
@@ -22,7 +27,7 @@ class AISDataFetchError(Exception):
         super().__init__(f"[{source}] {message}" if source else message)
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     """Metadata about an AIS data source."""
 
@@ -75,8 +80,12 @@ class AISDataAdapter(ABC):
         self.is_enabled = config.get("enabled", True)
         self._error_count = 0
         self._total_messages = 0
-        self._last_fetch_time: Optional[datetime] = None
-        self._latency_samples: list[float] = []
+        # Last successful fetch on the monotonic clock (0 = never); converted
+        # to wall-clock time only when read
+        self._last_fetch_ns = 0
+        self._epoch_ns_offset = time.time_ns() - time.monotonic_ns()
+        self._latency_samples: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._latency_sum = 0.0
         self._is_started = False
 
     @abstractmethod
@@ -130,6 +139,17 @@ class AISDataAdapter(ABC):
         self._is_started = False
         logger.info(f"Adapter '{self.name}' stopped")
 
+    def realize(self) -> "AISDataAdapter":
+        """Return the adapter that does the actual work.
+
+        Placeholders for adapters whose creation is deferred return the
+        adapter they stand for; concrete adapters return themselves.
+
+        Returns:
+            The concrete adapter
+        """
+        return self
+
     def _record_success(self, message_count: int, latency_seconds: float = 0.0) -> None:
         """Record a successful fetch operation.
 
@@ -137,14 +157,16 @@ class AISDataAdapter(ABC):
             message_count: Number of messages received
             latency_seconds: Time taken to fetch data
         """
-        self._last_fetch_time = datetime.utcnow()
+        self._last_fetch_ns = time.monotonic_ns()
         self._error_count = 0
         self._total_messages += message_count
 
-        # Track latency (keep last 100 samples)
+        # Track latency over a fixed window with a running sum; the deque
+        # drops the oldest sample on append once full
+        if len(self._latency_samples) == LATENCY_SAMPLE_SIZE:
+            self._latency_sum -= self._latency_samples[0]
         self._latency_samples.append(latency_seconds)
-        if len(self._latency_samples) > 100:
-            self._latency_samples.pop(0)
+        self._latency_sum += latency_seconds
 
     def _record_error(self) -> None:
         """Record a failed fetch operation."""
@@ -154,7 +176,7 @@ class AISDataAdapter(ABC):
         """Calculate average latency from samples."""
         if not self._latency_samples:
             return 0.0
-        return sum(self._latency_samples) / len(self._latency_samples)
+        return self._latency_sum / len(self._latency_samples)
 
     @property
     def is_started(self) -> bool:
@@ -168,8 +190,12 @@ class AISDataAdapter(ABC):
 
     @property
     def last_fetch_time(self) -> Optional[datetime]:
-        """Get time of last successful fetch."""
-        return self._last_fetch_time
+        """Get time of last successful fetch (UTC)."""
+        if not self._last_fetch_ns:
+            return None
+        return datetime.fromtimestamp(
+            (self._last_fetch_ns + self._epoch_ns_offset) / 1e9, tz=timezone.utc
+        )
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name={self.name}, enabled={self.is_enabled})>"
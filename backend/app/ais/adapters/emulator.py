@@ -4,7 +4,7 @@ Provides AIS data from the traffic emulator for development and testing.
 """
 
 import logging
-from datetime import datetime
+import time
 from typing import Any, Optional
 
 from app.ais.adapters.base import (
@@ -116,13 +116,13 @@ class EmulatorAdapter(AISDataAdapter):
                 source=self.name,
             )
 
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
 
         try:
             messages = await self.emulator.get_ais_messages(bbox=bbox)
 
             # Record success
-            latency = (datetime.utcnow() - start_time).total_seconds()
+            latency = time.perf_counter() - start_time
             self._record_success(len(messages), latency)
 
             return messages
@@ -162,7 +162,7 @@ class EmulatorAdapter(AISDataAdapter):
             name=self.name,
             source_type="emulator",
             is_active=self.emulator is not None and self.emulator.is_running,
-            last_successful_fetch=self._last_fetch_time,
+            last_successful_fetch=self.last_fetch_time,
             error_count=self._error_count,
             total_messages_received=self._total_messages,
             average_latency_seconds=self._get_average_latency(),
@@ -181,6 +181,9 @@ class EmulatorAdapter(AISDataAdapter):
     async def load_scenario(self, scenario_file: str) -> None:
         """Load a new scenario into the running emulator.
 
+        The new emulation is started and prewarmed before it replaces the
+        current one, so there is no window in which fetches fail.
+
         Args:
             scenario_file: Path to scenario YAML file
 
@@ -193,15 +196,24 @@ class EmulatorAdapter(AISDataAdapter):
                 source=self.name,
             )
 
-        # Stop current emulation
-        await self.emulator.stop()
-
-        # Load new scenario
+        # Prepare the new emulation alongside the running one, so fetches
+        # keep being served meanwhile and a scenario that fails to load
+        # leaves the current emulation untouched
         scenario = load_scenario(scenario_file)
-        await self.emulator.load_scenario(scenario)
+        emulator = TrafficEmulator(update_interval=self.update_interval)
+        await emulator.load_scenario(scenario)
+        await emulator.start()
 
-        # Restart
-        await self.emulator.start()
+        # Prewarm: the first snapshot is built before any caller sees it
+        try:
+            await emulator.get_ais_messages()
+        except Exception:
+            await emulator.stop()
+            raise
+
+        # Swap, then stop the previous emulation
+        previous, self.emulator = self.emulator, emulator
+        await previous.stop()
 
         logger.info(f"Loaded new scenario: {scenario.name}")
 
@@ -6,18 +6,20 @@ to detect potential collision risks between vessels.
 
 import logging
 import math
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select, and_
+import numpy as np
+from sqlalchemy import and_, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ais._collision_kernel import classify_pairs, scan_pairs
 from app.models.vessel import Vessel
 from app.models.risk_alert import RiskAlert
-from app.socketio import emit_alert
+from app.socketio import emit_alert_batch
 from app.socketio.serializers import serialize_alert
 
 logger = logging.getLogger(__name__)
@@ -30,17 +32,66 @@ DEFAULT_CPA_THRESHOLD_NM = 0.5  # Alert if CPA < 0.5 nautical miles
 DEFAULT_TCPA_THRESHOLD_MIN = 30  # Only consider if TCPA < 30 minutes
 DEFAULT_MIN_SPEED_KNOTS = 0.5  # Ignore stationary vessels
 
+# Risk levels, most severe first; classify_pairs() returns indexes into this
+RISK_LEVELS = ("critical", "high", "medium", "low")
+
+# Scale of RiskAlert.risk_score (Numeric(5, 2))
+_RISK_SCORE_QUANTUM = Decimal("0.01")
+
+
+# Statements are built once at import and reused every cycle with new
+# parameters, so only the bound values change between runs
+
+# Moving vessels with recent positions; only the columns the kernel needs,
+# which skips ORM instances and the identity map entirely
+_MOVING_VESSELS_STMT = select(
+    Vessel.mmsi,
+    Vessel.name,
+    Vessel.last_latitude,
+    Vessel.last_longitude,
+    Vessel.last_speed,
+    Vessel.last_course,
+).where(
+    and_(
+        Vessel.last_position_time >= bindparam("cutoff"),
+        Vessel.last_speed >= bindparam("min_speed"),
+        Vessel.last_latitude.is_not(None),
+        Vessel.last_longitude.is_not(None),
+        Vessel.last_course.is_not(None),
+    )
+)
+
+# Active collision alerts created since the cutoff, oldest first
+_ACTIVE_COLLISION_ALERTS_STMT = (
+    select(RiskAlert)
+    .where(
+        and_(
+            RiskAlert.alert_type == "collision_risk",
+            RiskAlert.status == "active",
+            RiskAlert.created_at >= bindparam("cutoff"),
+        )
+    )
+    .order_by(RiskAlert.created_at)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class VesselState:
     """Current state of a vessel for collision calculations."""
-    mmsi: str
+    mmsi: int
     name: str
     latitude: float
     longitude: float
     speed: float  # knots
     course: float  # degrees
     length: Optional[float] = None
+    # Velocity components in knots (x = East, y = North), derived once here
+    # instead of for every pair the vessel takes part in
+    vx: float = field(init=False)
+    vy: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.vx, self.vy = calculate_velocity_components(self.speed, self.course)
 
     @classmethod
     def from_vessel(cls, vessel: Vessel) -> Optional["VesselState"]:
@@ -65,11 +116,54 @@ class VesselState:
 
 
 @dataclass
+class VesselStateBatch:
+    """Vessel states stored column-wise for the array collision kernel.
+
+    Each attribute is an array of length N; float columns are contiguous
+    float64 so scan_pairs() can use them without per-vessel lookups.
+    """
+    mmsi: np.ndarray  # int64
+    name: np.ndarray  # object (str)
+    latitude: np.ndarray
+    longitude: np.ndarray
+    speed: np.ndarray  # knots
+    vx: np.ndarray  # knots, East
+    vy: np.ndarray  # knots, North
+
+    def __len__(self) -> int:
+        return len(self.mmsi)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> "VesselStateBatch":
+        """Create a batch from (mmsi, name, lat, lon, speed, course) rows.
+
+        Rows must not contain NULL position, speed or course; filter those
+        in the query.
+        """
+        mmsi, name, lat, lon, speed, course = zip(*rows) if rows else ((),) * 6
+
+        speed = np.array(speed, dtype=np.float64)
+        course = np.radians(np.array(course, dtype=np.float64))
+
+        return cls(
+            mmsi=np.array(mmsi, dtype=np.int64),
+            name=np.array(
+                [n or f"Unknown ({m})" for m, n in zip(mmsi, name)], dtype=object
+            ),
+            latitude=np.array(lat, dtype=np.float64),
+            longitude=np.array(lon, dtype=np.float64),
+            speed=speed,
+            vx=speed * np.sin(course),
+            vy=speed * np.cos(course),
+        )
+
+
+@dataclass(slots=True)
 class CollisionRisk:
     """Result of collision risk calculation between two vessels."""
-    vessel1_mmsi: str
+    vessel1_mmsi: int
     vessel1_name: str
-    vessel2_mmsi: str
+    vessel2_mmsi: int
     vessel2_name: str
     cpa: float  # Closest Point of Approach in nautical miles
     tcpa: float  # Time to CPA in minutes
@@ -86,7 +180,10 @@ class CollisionRisk:
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points in nautical miles.
+    """Calculate great-circle distance between two points in nautical miles.
+
+    Not used on the collision hot path, which takes the flat-earth distance
+    from calculate_cpa_tcpa().
 
     Args:
         lat1, lon1: First position (degrees)
@@ -104,7 +201,8 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     dlon = lon2_rad - lon1_rad
 
     a = math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # Clamp against rounding pushing a just past 1 for antipodal points
+    c = 2 * math.asin(math.sqrt(min(1.0, a)))
 
     return EARTH_RADIUS_NM * c
 
@@ -128,46 +226,46 @@ def calculate_velocity_components(speed: float, course: float) -> tuple[float, f
 def calculate_cpa_tcpa(
     vessel1: VesselState,
     vessel2: VesselState,
-) -> tuple[float, float]:
-    """Calculate CPA and TCPA between two vessels.
+    cos_lat: Optional[float] = None,
+) -> tuple[float, float, float]:
+    """Calculate CPA, TCPA and current distance between two vessels.
 
     Uses relative velocity method to find closest point of approach.
 
     Args:
         vessel1: First vessel state
         vessel2: Second vessel state
+        cos_lat: Precomputed cosine of the pair's mean latitude; computed
+            here when omitted
 
     Returns:
-        (cpa, tcpa) - CPA in nautical miles, TCPA in minutes
-        TCPA is negative if vessels are moving apart
+        (cpa, tcpa, current_distance) - CPA and current distance in nautical
+        miles, TCPA in minutes. TCPA is negative if vessels are moving apart
     """
     # Convert positions to approximate Cartesian (nm from vessel1)
     # This is an approximation valid for short distances
-    avg_lat = (vessel1.latitude + vessel2.latitude) / 2
+    if cos_lat is None:
+        cos_lat = math.cos(math.radians((vessel1.latitude + vessel2.latitude) / 2))
     nm_per_deg_lat = 60.0
-    nm_per_deg_lon = 60.0 * math.cos(math.radians(avg_lat))
+    nm_per_deg_lon = 60.0 * cos_lat
 
     # Relative position of vessel2 from vessel1 (in nm)
     dx = (vessel2.longitude - vessel1.longitude) * nm_per_deg_lon
     dy = (vessel2.latitude - vessel1.latitude) * nm_per_deg_lat
 
-    # Velocity components
-    v1x, v1y = calculate_velocity_components(vessel1.speed, vessel1.course)
-    v2x, v2y = calculate_velocity_components(vessel2.speed, vessel2.course)
-
     # Relative velocity of vessel2 with respect to vessel1
-    dvx = v2x - v1x
-    dvy = v2y - v1y
+    dvx = vessel2.vx - vessel1.vx
+    dvy = vessel2.vy - vessel1.vy
 
     # Relative speed squared
     dv_squared = dvx * dvx + dvy * dvy
 
     # Current distance
-    current_distance = math.sqrt(dx * dx + dy * dy)
+    current_distance = math.hypot(dx, dy)
 
     # If relative velocity is essentially zero, vessels maintain current distance
     if dv_squared < 0.0001:
-        return current_distance, float('inf')
+        return current_distance, float('inf'), current_distance
 
     # Time to CPA (in hours, since speed is in knots = nm/hour)
     # TCPA = -(relative_position · relative_velocity) / |relative_velocity|²
@@ -181,9 +279,35 @@ def calculate_cpa_tcpa(
     cpa_dy = dy + dvy * tcpa_hours
 
     # CPA distance
-    cpa = math.sqrt(cpa_dx * cpa_dx + cpa_dy * cpa_dy)
+    cpa = math.hypot(cpa_dx, cpa_dy)
 
-    return cpa, tcpa_minutes
+    return cpa, tcpa_minutes, current_distance
+
+
+def classify_risk_level(
+    cpa: float,
+    tcpa: float,
+    cpa_threshold_nm: float = DEFAULT_CPA_THRESHOLD_NM,
+) -> Optional[str]:
+    """Map CPA/TCPA to a risk level.
+
+    Args:
+        cpa: Closest point of approach (nautical miles)
+        tcpa: Time to CPA (minutes)
+        cpa_threshold_nm: CPA threshold for alerts (nautical miles)
+
+    Returns:
+        'critical', 'high', 'medium', 'low', or None if there is no risk
+    """
+    if cpa < cpa_threshold_nm * 0.5 and tcpa < 10:
+        return "critical"
+    if cpa < cpa_threshold_nm and tcpa < 15:
+        return "high"
+    if cpa < cpa_threshold_nm * 1.5 and tcpa < 20:
+        return "medium"
+    if cpa < cpa_threshold_nm * 2:
+        return "low"
+    return None
 
 
 def assess_collision_risk(
@@ -207,29 +331,28 @@ def assess_collision_risk(
     if vessel1.speed < DEFAULT_MIN_SPEED_KNOTS or vessel2.speed < DEFAULT_MIN_SPEED_KNOTS:
         return None
 
-    # Calculate CPA and TCPA
-    cpa, tcpa = calculate_cpa_tcpa(vessel1, vessel2)
-
-    # Current distance
-    current_distance = haversine_distance(
-        vessel1.latitude, vessel1.longitude,
-        vessel2.latitude, vessel2.longitude,
+    # Cheap box test first: the vessels close at most at their combined speed,
+    # and a risk needs CPA below twice the threshold. Chebyshev distance never
+    # exceeds the Euclidean one, so no reportable pair is dropped
+    max_closure_nm = (
+        (vessel1.speed + vessel2.speed) * tcpa_threshold_min / 60 + cpa_threshold_nm * 2
     )
+    if abs(vessel2.latitude - vessel1.latitude) * 60.0 > max_closure_nm:
+        return None
+    cos_lat = math.cos(math.radians((vessel1.latitude + vessel2.latitude) / 2))
+    if abs(vessel2.longitude - vessel1.longitude) * 60.0 * cos_lat > max_closure_nm:
+        return None
+
+    # Calculate CPA and TCPA; the flat-earth current distance is within 0.1%
+    # of the great-circle one at collision-relevant ranges
+    cpa, tcpa, current_distance = calculate_cpa_tcpa(vessel1, vessel2, cos_lat)
 
     # Only consider future collisions (TCPA > 0) within time window
     if tcpa < 0 or tcpa > tcpa_threshold_min:
         return None
 
-    # Determine risk level based on CPA and TCPA
-    if cpa < cpa_threshold_nm * 0.5 and tcpa < 10:
-        risk_level = "critical"
-    elif cpa < cpa_threshold_nm and tcpa < 15:
-        risk_level = "high"
-    elif cpa < cpa_threshold_nm * 1.5 and tcpa < 20:
-        risk_level = "medium"
-    elif cpa < cpa_threshold_nm * 2:
-        risk_level = "low"
-    else:
+    risk_level = classify_risk_level(cpa, tcpa, cpa_threshold_nm)
+    if risk_level is None:
         return None
 
     return CollisionRisk(
@@ -263,61 +386,84 @@ async def detect_collision_risks(
     """
     # Get all moving vessels with recent positions
     from datetime import timedelta
-    cutoff_time = datetime.utcnow() - timedelta(minutes=10)
+    cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=10)
 
     result = await session.execute(
-        select(Vessel).where(
-            and_(
-                Vessel.last_position_time >= cutoff_time,
-                Vessel.last_speed >= Decimal(str(min_speed_knots)),
-                Vessel.last_latitude.is_not(None),
-                Vessel.last_longitude.is_not(None),
-                Vessel.last_course.is_not(None),
-            )
-        )
+        _MOVING_VESSELS_STMT,
+        {"cutoff": cutoff_time, "min_speed": min_speed_knots},
     )
-    vessels = result.scalars().all()
+    batch = VesselStateBatch.from_rows(result.all())
+
+    logger.debug(f"Checking {len(batch)} moving vessels for collision risks")
+
+    return find_collision_risks(batch, cpa_threshold_nm, tcpa_threshold_min)
 
-    # Convert to VesselState objects
-    vessel_states = []
-    for v in vessels:
-        state = VesselState.from_vessel(v)
-        if state:
-            vessel_states.append(state)
 
-    logger.debug(f"Checking {len(vessel_states)} moving vessels for collision risks")
+def find_collision_risks(
+    batch: VesselStateBatch,
+    cpa_threshold_nm: float = DEFAULT_CPA_THRESHOLD_NM,
+    tcpa_threshold_min: float = DEFAULT_TCPA_THRESHOLD_MIN,
+) -> list[CollisionRisk]:
+    """Find collision risks among the vessels of a batch.
+
+    Gives the same risks as assess_collision_risk() on every pair.
 
-    # Check all pairs
+    Args:
+        batch: Vessel states
+        cpa_threshold_nm: CPA threshold for alerts
+        tcpa_threshold_min: Time window to consider
+
+    Returns:
+        Collision risks, most severe first, then soonest TCPA
+    """
+    # Evaluate all pairs in the array kernel; only the pairs that survive
+    # its filters become CollisionRisk objects
     risks = []
-    for i, v1 in enumerate(vessel_states):
-        for v2 in vessel_states[i + 1:]:
-            risk = assess_collision_risk(
-                v1, v2,
-                cpa_threshold_nm=cpa_threshold_nm,
-                tcpa_threshold_min=tcpa_threshold_min,
-            )
-            if risk:
-                risks.append(risk)
+    if len(batch) >= 2:
+        i_idx, j_idx, cpa, tcpa, dist = scan_pairs(
+            batch.latitude,
+            batch.longitude,
+            batch.speed,
+            batch.vx,
+            batch.vy,
+            cpa_thr=cpa_threshold_nm,
+            tcpa_thr=tcpa_threshold_min,
+            min_speed=DEFAULT_MIN_SPEED_KNOTS,
+        )
 
-    # Sort by risk level (critical first) and TCPA
-    risk_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    risks.sort(key=lambda r: (risk_order.get(r.risk_level, 4), r.tcpa))
+        labels = classify_pairs(cpa, tcpa, cpa_threshold_nm)
+
+        # Critical first, then soonest TCPA; lexsort sorts by its last key
+        # first and is stable
+        order = np.lexsort((tcpa, labels))
+        order = order[labels[order] < len(RISK_LEVELS)]
+
+        mmsi = batch.mmsi.tolist()
+        for k in order.tolist():
+            i = int(i_idx[k])
+            j = int(j_idx[k])
+            risks.append(CollisionRisk(
+                vessel1_mmsi=mmsi[i],
+                vessel1_name=batch.name[i],
+                vessel2_mmsi=mmsi[j],
+                vessel2_name=batch.name[j],
+                cpa=round(float(cpa[k]), 3),
+                tcpa=round(float(tcpa[k]), 1),
+                current_distance=round(float(dist[k]), 3),
+                risk_level=RISK_LEVELS[labels[k]],
+            ))
 
     return risks
 
 
-async def create_collision_alert(
-    session: AsyncSession,
-    risk: CollisionRisk,
-) -> RiskAlert:
-    """Create a collision risk alert in the database.
+def build_collision_alert(risk: CollisionRisk) -> RiskAlert:
+    """Build a collision risk alert without adding it to a session.
 
     Args:
-        session: Database session
         risk: Collision risk details
 
     Returns:
-        Created RiskAlert
+        New RiskAlert
     """
     # Map risk level to severity
     severity_map = {
@@ -336,7 +482,9 @@ async def create_collision_alert(
         f"Current distance: {risk.current_distance:.2f} nm."
     )
 
-    alert = RiskAlert(
+    risk_score = min(100.0, (1 - risk.cpa) * 50 + (30 - risk.tcpa) * 2)
+
+    return RiskAlert(
         id=uuid4(),
         alert_type="collision_risk",
         severity=severity,
@@ -345,7 +493,7 @@ async def create_collision_alert(
         message=message,
         vessel_mmsi=risk.vessel1_mmsi,
         secondary_vessel_mmsi=risk.vessel2_mmsi,
-        risk_score=Decimal(str(min(100, (1 - risk.cpa) * 50 + (30 - risk.tcpa) * 2))),
+        risk_score=Decimal(risk_score).quantize(_RISK_SCORE_QUANTUM),
         details={
             "cpa_nm": risk.cpa,
             "tcpa_minutes": risk.tcpa,
@@ -362,54 +510,31 @@ async def create_collision_alert(
         },
     )
 
-    session.add(alert)
-
-    # Emit alert via Socket.IO for real-time notification
-    try:
-        alert_data = serialize_alert(alert)
-        await emit_alert(alert_data)
-    except Exception as e:
-        logger.warning(f"Failed to emit collision alert: {e}")
-
-    return alert
 
-
-async def check_existing_collision_alert(
+async def get_active_collision_alerts(
     session: AsyncSession,
-    mmsi1: str,
-    mmsi2: str,
-) -> Optional[RiskAlert]:
-    """Check if an active collision alert already exists for this vessel pair.
+) -> dict[frozenset[int], RiskAlert]:
+    """Fetch recent active collision alerts keyed by vessel pair.
 
     Args:
         session: Database session
-        mmsi1: First vessel MMSI
-        mmsi2: Second vessel MMSI
 
     Returns:
-        Existing alert if found, None otherwise
+        Mapping of frozenset({mmsi1, mmsi2}) to the newest active alert
+        for that pair
     """
     from datetime import timedelta
 
-    # Check for recent active alerts (within last 10 minutes)
-    cutoff_time = datetime.utcnow() - timedelta(minutes=10)
+    # Recent active alerts (within last 10 minutes)
+    cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=10)
 
-    result = await session.execute(
-        select(RiskAlert).where(
-            and_(
-                RiskAlert.alert_type == "collision_risk",
-                RiskAlert.status == "active",
-                RiskAlert.created_at >= cutoff_time,
-                # Check both orderings of vessel pair
-                (
-                    (RiskAlert.vessel_mmsi == mmsi1) & (RiskAlert.secondary_vessel_mmsi == mmsi2)
-                ) | (
-                    (RiskAlert.vessel_mmsi == mmsi2) & (RiskAlert.secondary_vessel_mmsi == mmsi1)
-                ),
-            )
-        )
-    )
-    return result.scalar_one_or_none()
+    result = await session.execute(_ACTIVE_COLLISION_ALERTS_STMT, {"cutoff": cutoff_time})
+
+    # Oldest first, so the newest alert for a pair wins
+    return {
+        frozenset((alert.vessel_mmsi, alert.secondary_vessel_mmsi)): alert
+        for alert in result.scalars()
+    }
 
 
 async def run_collision_detection(
@@ -436,14 +561,14 @@ async def run_collision_detection(
 
     logger.info(f"Detected {len(risks)} potential collision risks")
 
-    alerts_created = 0
     alerts_updated = 0
+    new_alerts: list[RiskAlert] = []
+
+    # One query for all pairs instead of a lookup per risk
+    existing_alerts = await get_active_collision_alerts(session) if risks else {}
 
     for risk in risks:
-        # Check if alert already exists
-        existing = await check_existing_collision_alert(
-            session, risk.vessel1_mmsi, risk.vessel2_mmsi
-        )
+        existing = existing_alerts.get(frozenset((risk.vessel1_mmsi, risk.vessel2_mmsi)))
 
         if existing:
             # Update existing alert with new CPA/TCPA values
@@ -453,25 +578,33 @@ async def run_collision_detection(
                 "tcpa_minutes": risk.tcpa,
                 "current_distance_nm": risk.current_distance,
                 "risk_level": risk.risk_level,
-                "last_updated": datetime.utcnow().isoformat(),
+                "last_updated": datetime.now(timezone.utc).isoformat(),
             })
-            existing.updated_at = datetime.utcnow()
+            existing.updated_at = datetime.now(timezone.utc)
             alerts_updated += 1
             logger.debug(
                 f"Updated collision alert for {risk.vessel1_name}/{risk.vessel2_name}: "
                 f"CPA={risk.cpa:.2f}nm, TCPA={risk.tcpa:.1f}min"
             )
         else:
-            # Create new alert
-            alert = await create_collision_alert(session, risk)
-            alerts_created += 1
+            new_alerts.append(build_collision_alert(risk))
             logger.info(
                 f"Created collision alert: {risk.vessel1_name}/{risk.vessel2_name} - "
                 f"CPA={risk.cpa:.2f}nm, TCPA={risk.tcpa:.1f}min ({risk.risk_level})"
             )
 
+    session.add_all(new_alerts)
+
+    # One Socket.IO event for the whole cycle; risks are already ordered
+    # most severe first
+    if new_alerts:
+        try:
+            await emit_alert_batch([serialize_alert(alert) for alert in new_alerts])
+        except Exception as e:
+            logger.warning(f"Failed to emit collision alerts: {e}")
+
     return {
         "risks_detected": len(risks),
-        "alerts_created": alerts_created,
+        "alerts_created": len(new_alerts),
         "alerts_updated": alerts_updated,
     }
@@ -4,17 +4,20 @@ Handles loading AIS source configuration from YAML files
 and creating appropriate adapters based on environment.
 """
 
+import asyncio
+import importlib
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
-import yaml
+from app.ais.adapters.base import AISDataAdapter, AISDataFetchError, SourceInfo
+from app.ais.models import AISMessage, BoundingBox
 
-from app.ais.adapters.base import AISDataAdapter
-from app.ais.models import BoundingBox
-
-# Note: EmulatorAdapter is imported lazily in create_adapter() to avoid circular imports
+# Note: adapter classes are imported lazily in create_adapter() to avoid circular imports
 
 logger = logging.getLogger(__name__)
 
@@ -97,10 +100,42 @@ DEFAULT_CONFIGS = {
 }
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert a frozen config back into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Read-only view of DEFAULT_CONFIGS handed out by load_config(), so callers
+# share one tree and cannot change the defaults for everyone else
+_FROZEN_DEFAULTS: Mapping[str, Any] = _freeze(DEFAULT_CONFIGS)
+
+# ${VAR_NAME} references in config strings
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Environment configs loaded from YAML, keyed by (resolved path, mtime_ns,
+# environment) and stored frozen; an edited file gets a new key and is
+# parsed again
+_CONFIG_CACHE: dict[tuple[str, int, str], Mapping[str, Any]] = {}
+
+
 def _substitute_env_vars(value: Any) -> Any:
     """Substitute environment variables in string values.
 
-    Supports ${VAR_NAME} syntax.
+    Supports ${VAR_NAME} syntax anywhere in a string; unset variables become
+    empty strings. Dicts and lists are updated in place.
 
     Args:
         value: Value to process
@@ -108,28 +143,48 @@ def _substitute_env_vars(value: Any) -> Any:
     Returns:
         Value with environment variables substituted
     """
-    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-        env_var = value[2:-1]
-        return os.getenv(env_var, "")
+    if isinstance(value, str):
+        if "${" not in value:
+            return value
+        return _ENV_VAR_RE.sub(lambda m: os.getenv(m.group(1), ""), value)
     elif isinstance(value, dict):
-        return {k: _substitute_env_vars(v) for k, v in value.items()}
+        for k, v in value.items():
+            substituted = _substitute_env_vars(v)
+            if substituted is not v:
+                value[k] = substituted
     elif isinstance(value, list):
-        return [_substitute_env_vars(v) for v in value]
+        for i, v in enumerate(value):
+            substituted = _substitute_env_vars(v)
+            if substituted is not v:
+                value[i] = substituted
     return value
 
 
+def _config_cache_key(config_path: Path, environment: str) -> tuple[str, int, str]:
+    """Key of a config file's entry in _CONFIG_CACHE.
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    stat = config_path.stat()
+    return (str(config_path.resolve()), stat.st_mtime_ns, environment)
+
+
 def load_config(
     config_file: Optional[str] = None,
     environment: Optional[str] = None,
-) -> dict[str, Any]:
+    mutable: bool = False,
+) -> Mapping[str, Any]:
     """Load AIS configuration for specified environment.
 
     Args:
         config_file: Path to YAML config file (optional)
         environment: Environment name (development, testing, staging, production)
+        mutable: Return a private dict/list copy the caller may modify,
+            instead of the shared read-only mapping
 
     Returns:
-        Configuration dictionary for the environment
+        Configuration mapping for the environment
 
     Raises:
         AISConfigError: If configuration loading fails
@@ -144,16 +199,33 @@ def load_config(
     if config_file:
         config_path = Path(config_file)
         if config_path.exists():
+            cache_key = _config_cache_key(config_path, environment)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return _thaw(cached) if mutable else cached
+
+            # PyYAML is only imported when a config file is actually read;
+            # the default (built-in config) path never needs it. libyaml's C
+            # loader is used when PyYAML was built against it (the wheels are)
+            import yaml
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:  # PyYAML built without libyaml
+                from yaml import SafeLoader
+
             try:
-                with open(config_path, "r") as f:
-                    all_config = yaml.safe_load(f)
+                # Binary mode: libyaml detects the encoding and decodes in C,
+                # skipping the TextIOWrapper pass. An empty file loads as None
+                with open(config_path, "rb") as f:
+                    all_config = yaml.load(f, Loader=SafeLoader) or {}
 
                 if environment in all_config:
                     config = all_config[environment]
                     # Substitute environment variables
                     config = _substitute_env_vars(config)
+                    _CONFIG_CACHE[cache_key] = _freeze(config)
                     logger.info(f"Loaded configuration from {config_file}")
-                    return config
+                    return config if mutable else _CONFIG_CACHE[cache_key]
                 else:
                     logger.warning(
                         f"Environment '{environment}' not found in {config_file}, "
@@ -170,7 +242,92 @@ def load_config(
         )
         environment = "development"
 
-    return DEFAULT_CONFIGS[environment]
+    config = _FROZEN_DEFAULTS[environment]
+    return _thaw(config) if mutable else config
+
+
+async def load_config_async(
+    config_file: Optional[str] = None,
+    environment: Optional[str] = None,
+    mutable: bool = False,
+) -> Mapping[str, Any]:
+    """Load AIS configuration without blocking the event loop.
+
+    Cached and built-in configurations are returned directly; only reading
+    and parsing a config file runs in a worker thread.
+
+    Args:
+        config_file: Path to YAML config file (optional)
+        environment: Environment name (development, testing, staging, production)
+        mutable: Return a private dict/list copy the caller may modify
+
+    Returns:
+        Configuration mapping for the environment
+
+    Raises:
+        AISConfigError: If configuration loading fails
+    """
+    if config_file:
+        if environment is None:
+            environment = os.getenv("ENVIRONMENT", "development")
+        try:
+            cached = _CONFIG_CACHE.get(_config_cache_key(Path(config_file), environment))
+        except OSError:
+            cached = None
+        if cached is None:
+            return await asyncio.to_thread(load_config, config_file, environment, mutable)
+
+    return load_config(config_file, environment, mutable)
+
+
+# Adapter types mapped to "module:Class"; each class is imported on first use
+_ADAPTER_IMPORTS: dict[str, str] = {
+    "emulator": "app.ais.adapters.emulator:EmulatorAdapter",
+}
+
+# Adapter types that are planned but not implemented yet
+# TODO: Implement AISHubAdapter, MarineTrafficAdapter, PortReceiverAdapter
+_UNIMPLEMENTED_ADAPTERS: dict[str, str] = {
+    "aishub": "AISHub adapter",
+    "marinetraffic": "MarineTraffic adapter",
+    "port_receiver": "Port receiver adapter",
+}
+
+# Adapter classes resolved so far, keyed by adapter type
+_ADAPTER_FACTORIES: dict[str, Callable[[dict[str, Any]], AISDataAdapter]] = {}
+
+
+def _get_adapter_factory(
+    adapter_type: str,
+) -> Callable[[dict[str, Any]], AISDataAdapter]:
+    """Look up the adapter class for a type, importing it on first use.
+
+    Args:
+        adapter_type: Lower-case adapter type
+
+    Returns:
+        Callable that creates the adapter from its configuration
+
+    Raises:
+        AISConfigError: If adapter type is unknown or not implemented
+    """
+    factory = _ADAPTER_FACTORIES.get(adapter_type)
+    if factory is not None:
+        return factory
+
+    import_path = _ADAPTER_IMPORTS.get(adapter_type)
+    if import_path is None:
+        if adapter_type in _UNIMPLEMENTED_ADAPTERS:
+            raise AISConfigError(
+                f"{_UNIMPLEMENTED_ADAPTERS[adapter_type]} not yet implemented - "
+                f"use emulator for now"
+            )
+        raise AISConfigError(f"Unknown adapter type: {adapter_type}")
+
+    module_name, class_name = import_path.split(":")
+    factory = getattr(importlib.import_module(module_name), class_name)
+    _ADAPTER_FACTORIES[adapter_type] = factory
+    return factory
 
 
 def create_adapter(
@@ -189,38 +346,88 @@ def create_adapter(
     Raises:
         AISConfigError: If adapter type is unknown
     """
-    adapter_type = adapter_type.lower()
-
-    if adapter_type == "emulator":
-        # Lazy import to avoid circular imports
-        from app.ais.adapters.emulator import EmulatorAdapter
-        return EmulatorAdapter(config)
-    elif adapter_type == "aishub":
-        # TODO: Implement AISHubAdapter
-        raise AISConfigError(
-            "AISHub adapter not yet implemented - use emulator for now"
-        )
-    elif adapter_type == "marinetraffic":
-        # TODO: Implement MarineTrafficAdapter
-        raise AISConfigError(
-            "MarineTraffic adapter not yet implemented - use emulator for now"
-        )
-    elif adapter_type == "port_receiver":
-        # TODO: Implement PortReceiverAdapter
-        raise AISConfigError(
-            "Port receiver adapter not yet implemented - use emulator for now"
+    return _get_adapter_factory(adapter_type.lower())(config)
+
+
+class _LazyAdapter(AISDataAdapter):
+    """Placeholder for a fallback adapter that is only created when needed.
+
+    Holds the adapter type and configuration until realize() is called.
+    AISAdapterManager swaps the placeholder for the real adapter when it
+    first becomes active, so fallback sources that are never failed over to
+    are never instantiated or started.
+    """
+
+    def __init__(self, adapter_type: str, config: dict[str, Any]):
+        """Initialize placeholder.
+
+        Args:
+            adapter_type: Adapter type passed to create_adapter()
+            config: Adapter configuration
+        """
+        super().__init__(config)
+        self.adapter_type = adapter_type
+        self._adapter: Optional[AISDataAdapter] = None
+
+    def realize(self) -> AISDataAdapter:
+        """Create the real adapter on first call and return it."""
+        if self._adapter is None:
+            self._adapter = create_adapter(self.adapter_type, self.config)
+            logger.info(f"Created deferred adapter: {self.name} ({self.adapter_type})")
+        return self._adapter
+
+    async def fetch_data(
+        self, bbox: Optional[BoundingBox] = None
+    ) -> list[AISMessage]:
+        """Fetch data through the real adapter, creating it if needed."""
+        try:
+            adapter = self.realize()
+        except Exception as e:
+            self._record_error()
+            raise AISDataFetchError(f"Failed to create adapter: {e}", source=self.name) from e
+        return await adapter.fetch_data(bbox)
+
+    async def health_check(self) -> bool:
+        """Report enabled sources as healthy until they are created.
+
+        The real adapter is probed once it is realized; checking it here
+        would defeat the deferral on every status poll.
+        """
+        if self._adapter is None:
+            return self.is_enabled
+        return await self._adapter.health_check()
+
+    def get_source_info(self) -> SourceInfo:
+        """Get metadata about the source, noting if it is not created yet."""
+        if self._adapter is not None:
+            return self._adapter.get_source_info()
+        return SourceInfo(
+            name=self.name,
+            source_type=self.adapter_type,
+            is_active=False,
+            extra_info={"deferred": True},
         )
-    else:
-        raise AISConfigError(f"Unknown adapter type: {adapter_type}")
+
+    async def start(self) -> None:
+        """Defer starting until the real adapter is created."""
+        logger.info(f"Adapter '{self.name}' deferred until first use")
+
+    async def stop(self) -> None:
+        """Stop the real adapter if it was created."""
+        if self._adapter is not None:
+            await self._adapter.stop()
 
 
 def create_adapters_from_config(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
+    defer_fallbacks: bool = True,
 ) -> list[AISDataAdapter]:
     """Create all adapters from configuration dictionary.
 
     Args:
         config: Environment configuration dictionary
+        defer_fallbacks: Create only the first adapter now and the others
+            when the manager first fails over to them
 
     Returns:
         List of configured adapters
@@ -239,13 +446,21 @@ def create_adapters_from_config(
 
         try:
             adapter_type = source_config["type"]
-            adapter_config = source_config.get("config", {}).copy()
-            adapter_config["name"] = source_config.get("name", adapter_type)
-            adapter_config["enabled"] = source_config.get("enabled", True)
-
-            adapter = create_adapter(adapter_type, adapter_config)
+            adapter_config = {
+                **source_config.get("config", {}),
+                "name": source_config.get("name", adapter_type),
+                "enabled": source_config.get("enabled", True),
+            }
+
+            if adapters and defer_fallbacks:
+                # Resolve the type now so that unknown types still fail here
+                _get_adapter_factory(adapter_type.lower())
+                adapter = _LazyAdapter(adapter_type, adapter_config)
+                logger.info(f"Deferred adapter: {adapter.name} ({adapter_type})")
+            else:
+                adapter = create_adapter(adapter_type, adapter_config)
+                logger.info(f"Created adapter: {adapter.name} ({adapter_type})")
             adapters.append(adapter)
-            logger.info(f"Created adapter: {adapter.name} ({adapter_type})")
 
         except Exception as e:
             logger.error(
@@ -292,9 +507,13 @@ def create_default_adapter(
 CONFIG_FILE_PATH = "config/ais_sources.yaml"
 
 
+@lru_cache(maxsize=1)
 def get_config_file_path() -> Path:
     """Get the path to the AIS configuration file.
 
+    The location is resolved once per process; call
+    get_config_file_path.cache_clear() after changing the working directory.
+
     Returns:
         Path to config file
     """
@@ -4,8 +4,10 @@ Orchestrates data fetching from multiple AIS sources and handles
 automatic failover when primary sources fail.
 """
 
+import asyncio
+import inspect
 import logging
-from datetime import datetime
+import time
 from typing import Any, Optional
 
 from app.ais.adapters.base import AISDataAdapter, AISDataFetchError, SourceInfo
@@ -25,6 +27,23 @@ class AISAdapterManager:
     - Statistics tracking
     """
 
+    __slots__ = (
+        "adapters",
+        "active_adapter_index",
+        "failover_threshold",
+        "_next_index",
+        "_name_to_index",
+        "_health_checked",
+        "_needs_dedup",
+        "_pending_start",
+        "_total_fetches",
+        "_total_messages",
+        "_failover_count",
+        "_start_time",
+        "_is_started",
+        "_adapter_stats",
+    )
+
     def __init__(
         self,
         primary_adapter: AISDataAdapter,
@@ -49,13 +68,41 @@ class AISAdapterManager:
         self.active_adapter_index = 0
         self.failover_threshold = failover_threshold
 
+        # Failover order as a lookup table: index -> index of the next adapter
+        count = len(self.adapters)
+        self._next_index = tuple((i + 1) % count for i in range(count))
+
+        # Adapter name -> index for switch_adapter(); the first adapter wins
+        # if two share a name, matching the previous linear search
+        self._name_to_index: dict[str, int] = {}
+        for i, adapter in enumerate(self.adapters):
+            self._name_to_index.setdefault(adapter.name, i)
+
+        # Indexes of adapters whose health was confirmed before their first
+        # fetch; an index is dropped on failure so it is probed again
+        self._health_checked: set[int] = set()
+
+        # Indexes of adapters created on activation that still need start()
+        self._pending_start: set[int] = set()
+
+        # With a single source there are no cross-source duplicates to drop
+        self._needs_dedup = len(self.adapters) > 1
+
         # Statistics
         self._total_fetches = 0
         self._total_messages = 0
         self._failover_count = 0
-        self._start_time: Optional[datetime] = None
+        # time.monotonic() at start_all(); uptime is immune to clock changes
+        self._start_time: Optional[float] = None
         self._is_started = False
 
+        # Per-adapter entries of get_statistics(), built once and refreshed
+        # in place on each call
+        self._adapter_stats: list[dict[str, Any]] = [
+            {"name": a.name, "is_enabled": a.is_enabled, "is_started": False, "error_count": 0}
+            for a in self.adapters
+        ]
+
     @property
     def active_adapter(self) -> AISDataAdapter:
         """Get the currently active adapter."""
@@ -79,14 +126,11 @@ class AISAdapterManager:
     async def start_all(self) -> None:
         """Initialize and start all adapters."""
         logger.info(f"Starting AIS Adapter Manager with {len(self.adapters)} adapters")
-        self._start_time = datetime.utcnow()
+        self._start_time = time.monotonic()
 
-        for adapter in self.adapters:
-            try:
-                await adapter.start()
-                logger.info(f"  Started adapter: {adapter.name}")
-            except Exception as e:
-                logger.error(f"  Failed to start adapter {adapter.name}: {e}")
+        # Adapters are independent, so start them concurrently; a failing
+        # adapter is logged and does not hold up the others
+        await asyncio.gather(*(self._start_adapter(a) for a in self.adapters))
 
         self._is_started = True
         logger.info(f"Active adapter: {self.active_adapter.name}")
@@ -95,15 +139,28 @@ class AISAdapterManager:
         """Stop all adapters."""
         logger.info("Stopping AIS Adapter Manager")
 
-        for adapter in self.adapters:
-            try:
-                await adapter.stop()
-                logger.info(f"  Stopped adapter: {adapter.name}")
-            except Exception as e:
-                logger.error(f"  Error stopping adapter {adapter.name}: {e}")
+        await asyncio.gather(*(self._stop_adapter(a) for a in self.adapters))
 
         self._is_started = False
 
+    @staticmethod
+    async def _start_adapter(adapter: AISDataAdapter) -> None:
+        """Start one adapter, logging instead of raising on failure."""
+        try:
+            await adapter.start()
+            logger.info(f"  Started adapter: {adapter.name}")
+        except Exception as e:
+            logger.error(f"  Failed to start adapter {adapter.name}: {e}")
+
+    @staticmethod
+    async def _stop_adapter(adapter: AISDataAdapter) -> None:
+        """Stop one adapter, logging instead of raising on failure."""
+        try:
+            await adapter.stop()
+            logger.info(f"  Stopped adapter: {adapter.name}")
+        except Exception as e:
+            logger.error(f"  Error stopping adapter {adapter.name}: {e}")
+
     async def fetch_data(
         self, bbox: Optional[BoundingBox] = None
     ) -> list[AISMessage]:
@@ -120,38 +177,58 @@ class AISAdapterManager:
         """
         self._total_fetches += 1
 
+        adapters = self.adapters
+        adapter_count = len(adapters)
+
         # Try each adapter in order starting from active
-        for attempt in range(len(self.adapters)):
-            adapter = self.adapters[self.active_adapter_index]
+        for attempt in range(adapter_count):
+            index = self.active_adapter_index
+            adapter = adapters[index]
 
             try:
-                # Check health first
-                if not await adapter.health_check():
-                    raise AISDataFetchError(
-                        f"Health check failed",
-                        source=adapter.name,
-                    )
+                # Adapters created on failover are started on first use
+                if index in self._pending_start:
+                    try:
+                        await adapter.start()
+                    except Exception as e:
+                        raise AISDataFetchError(
+                            f"Failed to start: {e}",
+                            source=adapter.name,
+                        ) from e
+                    self._pending_start.discard(index)
+
+                # Probe health only before an adapter's first fetch or after
+                # it failed; otherwise a failing fetch is the health signal
+                if index not in self._health_checked:
+                    if not await adapter.health_check():
+                        raise AISDataFetchError(
+                            f"Health check failed",
+                            source=adapter.name,
+                        )
+                    self._health_checked.add(index)
 
                 # Fetch data
                 messages = await adapter.fetch_data(bbox)
 
                 # Deduplicate messages
-                messages = self._deduplicate_messages(messages)
+                if self._needs_dedup:
+                    messages = self._deduplicate_messages(messages)
 
                 self._total_messages += len(messages)
 
                 logger.debug(
-                    f"Fetched {len(messages)} messages from {adapter.name}"
+                    "Fetched %d messages from %s", len(messages), adapter.name
                 )
 
                 return messages
 
             except AISDataFetchError as e:
-                logger.warning(f"Adapter {adapter.name} failed: {e}")
+                logger.warning("Adapter %s failed: %s", adapter.name, e)
+                self._health_checked.discard(index)
 
                 # Check if we should failover
                 if adapter.error_count >= self.failover_threshold:
-                    if attempt < len(self.adapters) - 1:
+                    if attempt < adapter_count - 1:
                         self._perform_failover()
                     else:
                         logger.error("All adapters have failed")
@@ -168,16 +245,36 @@ class AISAdapterManager:
         old_index = self.active_adapter_index
         old_name = self.adapters[old_index].name
 
-        self.active_adapter_index = (self.active_adapter_index + 1) % len(self.adapters)
+        self.active_adapter_index = self._next_index[old_index]
+        self._activate(self.active_adapter_index)
         new_name = self.adapters[self.active_adapter_index].name
 
         self._failover_count += 1
 
         logger.warning(
-            f"Failover: {old_name} -> {new_name} "
-            f"(total failovers: {self._failover_count})"
+            "Failover: %s -> %s (total failovers: %d)",
+            old_name,
+            new_name,
+            self._failover_count,
         )
 
+    def _activate(self, index: int) -> None:
+        """Replace a deferred adapter with the real one before it is used.
+
+        Args:
+            index: Index of the adapter about to become active
+        """
+        adapter = self.adapters[index]
+        try:
+            real = adapter.realize()
+        except Exception as e:
+            # Leave the placeholder; its fetch_data() reports the failure
+            logger.error("Failed to create adapter %s: %s", adapter.name, e)
+            return
+        if real is not adapter:
+            self.adapters[index] = real
+            self._pending_start.add(index)
+
     def _deduplicate_messages(
         self, messages: list[AISMessage]
     ) -> list[AISMessage]:
@@ -192,12 +289,10 @@ class AISAdapterManager:
         seen: dict[int, AISMessage] = {}
 
         for msg in messages:
-            if msg.mmsi not in seen:
+            current = seen.get(msg.mmsi)
+            # Keep the first message, or a later one with higher quality
+            if current is None or msg.source_quality > current.source_quality:
                 seen[msg.mmsi] = msg
-            else:
-                # Keep message with higher quality
-                if msg.source_quality > seen[msg.mmsi].source_quality:
-                    seen[msg.mmsi] = msg
 
         return list(seen.values())
 
@@ -210,15 +305,16 @@ class AISAdapterManager:
         Returns:
             True if switch was successful
         """
-        for i, adapter in enumerate(self.adapters):
-            if adapter.name == adapter_name:
-                old_name = self.active_adapter.name
-                self.active_adapter_index = i
-                logger.info(f"Manual switch: {old_name} -> {adapter_name}")
-                return True
+        i = self._name_to_index.get(adapter_name)
+        if i is None:
+            logger.warning(f"Adapter not found: {adapter_name}")
+            return False
 
-        logger.warning(f"Adapter not found: {adapter_name}")
-        return False
+        old_name = self.active_adapter.name
+        self.active_adapter_index = i
+        self._activate(i)
+        logger.info(f"Manual switch: {old_name} -> {adapter_name}")
+        return True
 
     async def get_all_source_info(self) -> list[SourceInfo]:
         """Get status of all configured sources.
@@ -226,7 +322,17 @@ class AISAdapterManager:
         Returns:
             List of SourceInfo objects
         """
-        return [adapter.get_source_info() for adapter in self.adapters]
+        infos = [adapter.get_source_info() for adapter in self.adapters]
+
+        # Remote adapters may implement get_source_info() as a coroutine;
+        # await those together rather than one after another
+        pending = [i for i, info in enumerate(infos) if inspect.isawaitable(info)]
+        if pending:
+            resolved = await asyncio.gather(*(infos[i] for i in pending))
+            for i, info in zip(pending, resolved):
+                infos[i] = info
+
+        return infos
 
     async def health_check_all(self) -> dict[str, bool]:
         """Check health of all adapters.
@@ -234,23 +340,33 @@ class AISAdapterManager:
         Returns:
             Dictionary mapping adapter names to health status
         """
-        results = {}
-        for adapter in self.adapters:
-            try:
-                results[adapter.name] = await adapter.health_check()
-            except Exception:
-                results[adapter.name] = False
-        return results
+        results = await asyncio.gather(
+            *(adapter.health_check() for adapter in self.adapters),
+            return_exceptions=True,
+        )
+        return {
+            adapter.name: result if isinstance(result, bool) else False
+            for adapter, result in zip(self.adapters, results)
+        }
 
     def get_statistics(self) -> dict[str, Any]:
         """Get manager statistics.
 
+        The top-level dictionary is new on every call, but the per-adapter
+        entries under "adapters" are shared and refreshed in place; callers
+        must not modify or keep them.
+
         Returns:
             Dictionary with manager statistics
         """
         uptime = 0.0
-        if self._start_time:
-            uptime = (datetime.utcnow() - self._start_time).total_seconds()
+        if self._start_time is not None:
+            uptime = time.monotonic() - self._start_time
+
+        for entry, adapter in zip(self._adapter_stats, self.adapters):
+            entry["is_enabled"] = adapter.is_enabled
+            entry["is_started"] = adapter.is_started
+            entry["error_count"] = adapter.error_count
 
         return {
             "is_started": self._is_started,
@@ -261,15 +377,7 @@ class AISAdapterManager:
             "total_messages": self._total_messages,
             "failover_count": self._failover_count,
             "uptime_seconds": uptime,
-            "adapters": [
-                {
-                    "name": a.name,
-                    "is_enabled": a.is_enabled,
-                    "is_started": a.is_started,
-                    "error_count": a.error_count,
-                }
-                for a in self.adapters
-            ],
+            "adapters": self._adapter_stats,
         }
 
     def __repr__(self) -> str:
@@ -301,4 +409,6 @@ def set_ais_manager(manager: AISAdapterManager) -> None:
     """
     global _manager
     _manager = manager
-    logger.info(f"Global AIS manager set: {manager}")
+    # Lazy formatting: __repr__ walks every adapter, so only build it
+    # when the record is actually emitted
+    logger.info("Global AIS manager set: %r", manager)
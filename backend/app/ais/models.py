@@ -3,8 +3,8 @@
 Source-agnostic data structures for AIS messages and related types.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime, timezone
 from enum import IntEnum, Enum
 from typing import Any, Optional
 
@@ -34,33 +34,14 @@ class NavigationStatus(IntEnum):
         """Create NavigationStatus from AIS code."""
         if code is None:
             return None
-        try:
-            return cls(code)
-        except ValueError:
-            return cls.NOT_DEFINED
+        if 0 <= code <= 15:
+            return _NAV_BY_CODE[code]
+        return cls.NOT_DEFINED
 
     @property
     def display_text(self) -> str:
         """Return human-readable status text."""
-        status_map = {
-            0: "Under way using engine",
-            1: "At anchor",
-            2: "Not under command",
-            3: "Restricted manoeuvrability",
-            4: "Constrained by draught",
-            5: "Moored",
-            6: "Aground",
-            7: "Engaged in fishing",
-            8: "Under way sailing",
-            9: "Reserved for HSC",
-            10: "Reserved for WIG",
-            11: "Reserved",
-            12: "Reserved",
-            13: "Reserved",
-            14: "AIS-SART active",
-            15: "Not defined",
-        }
-        return status_map.get(self.value, "Unknown")
+        return _NAV_STATUS_TEXT[self.value]
 
 
 class VesselType(Enum):
@@ -88,45 +69,71 @@ class VesselType(Enum):
         if code is None:
             return cls.UNKNOWN
 
-        # AIS ship type ranges
-        if 70 <= code <= 79:
-            return cls.CARGO
-        elif 80 <= code <= 89:
-            return cls.TANKER
-        elif 60 <= code <= 69:
-            return cls.PASSENGER
-        elif code == 30:
-            return cls.FISHING
-        elif code == 35:
-            return cls.MILITARY
-        elif 36 <= code <= 37:
-            return cls.PLEASURE_CRAFT
-        elif 40 <= code <= 49:
-            return cls.HIGH_SPEED_CRAFT
-        elif 31 <= code <= 32:
-            return cls.TUG
-        elif code == 50:
-            return cls.PILOT_VESSEL
-        elif code == 51:
-            return cls.SEARCH_AND_RESCUE
-        elif code == 33:
-            return cls.DREDGER
-        elif code == 55:
-            return cls.LAW_ENFORCEMENT
-        elif code == 36:
-            return cls.SAILING
-        elif code == 0:
-            return cls.UNKNOWN
-        else:
-            return cls.OTHER
+        if 0 <= code < 256:
+            return _SHIP_TYPE_TABLE[code]
+        return cls.OTHER
 
     @property
     def display_text(self) -> str:
         """Return human-readable vessel type."""
-        return self.value.replace("_", " ").title()
-
-
-@dataclass
+        return _VESSEL_TYPE_TEXT[self]
+
+
+# NavigationStatus members indexed by code, bypassing the Enum call machinery
+_NAV_BY_CODE = tuple(NavigationStatus)
+
+# Display text per navigation status, indexed by code
+_NAV_STATUS_TEXT = (
+    "Under way using engine",
+    "At anchor",
+    "Not under command",
+    "Restricted manoeuvrability",
+    "Constrained by draught",
+    "Moored",
+    "Aground",
+    "Engaged in fishing",
+    "Under way sailing",
+    "Reserved for HSC",
+    "Reserved for WIG",
+    "Reserved",
+    "Reserved",
+    "Reserved",
+    "AIS-SART active",
+    "Not defined",
+)
+
+# Display text per vessel type, e.g. "pleasure_craft" -> "Pleasure Craft"
+_VESSEL_TYPE_TEXT = {t: t.value.replace("_", " ").title() for t in VesselType}
+
+
+def _build_ship_type_table() -> tuple[VesselType, ...]:
+    """Map every AIS ship type code (0-255) to its VesselType."""
+    table = [VesselType.OTHER] * 256
+    for first, last, vessel_type in (
+        (70, 79, VesselType.CARGO),
+        (80, 89, VesselType.TANKER),
+        (60, 69, VesselType.PASSENGER),
+        (40, 49, VesselType.HIGH_SPEED_CRAFT),
+        (31, 32, VesselType.TUG),
+    ):
+        table[first:last + 1] = [vessel_type] * (last - first + 1)
+    table[0] = VesselType.UNKNOWN
+    table[30] = VesselType.FISHING
+    table[33] = VesselType.DREDGER
+    table[35] = VesselType.MILITARY
+    table[36] = VesselType.SAILING
+    table[37] = VesselType.PLEASURE_CRAFT
+    table[50] = VesselType.PILOT_VESSEL
+    table[51] = VesselType.SEARCH_AND_RESCUE
+    table[55] = VesselType.LAW_ENFORCEMENT
+    return tuple(table)
+
+
+# VesselType per AIS ship type code, indexed by code
+_SHIP_TYPE_TABLE = _build_ship_type_table()
+
+
+@dataclass(slots=True)
 class BoundingBox:
     """Geographic bounding box for spatial queries."""
 
@@ -163,7 +170,7 @@ class BoundingBox:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Geographic position (latitude, longitude)."""
 
@@ -182,12 +189,13 @@ class Position:
         return (self.latitude, self.longitude)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AISMessage:
     """Source-agnostic AIS message representation.
 
     This dataclass represents the internal format for AIS data,
     independent of the original data source (emulator, AISHub, port receiver, etc.).
+    Messages are immutable once constructed and normalized.
     """
 
     # Required fields
@@ -230,10 +238,22 @@ class AISMessage:
     raw_message: Optional[str] = None  # Original message for debugging
 
     # Reception metadata
-    received_at: datetime = field(default_factory=datetime.utcnow)
+    received_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
-    def __post_init__(self) -> None:
+    # Internal producers that already guarantee a valid 9-digit MMSI,
+    # coordinates in range, speed within 0-102.2 knots, course in [0, 360)
+    # and heading in 0-359 pass False to skip __post_init__'s checks
+    _validate: InitVar[bool] = True
+
+    # Derived values, computed on first access and then cached
+    _mmsi_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _position: Optional[Position] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self, _validate: bool) -> None:
         """Validate and normalize message data."""
+        if not _validate:
+            return
+
         # Validate MMSI (9 digits)
         if not (100000000 <= self.mmsi <= 999999999):
             raise ValueError(f"Invalid MMSI: {self.mmsi}")
@@ -244,25 +264,38 @@ class AISMessage:
         if not (-180 <= self.longitude <= 180):
             raise ValueError(f"Invalid longitude: {self.longitude}")
 
+        # The dataclass is frozen, so normalized values are written directly.
+        # Values are nearly always in range already; the range test is a
+        # single chained comparison, so only out-of-range values pay for
+        # the normalization and the write
+
         # Normalize speed
-        if self.speed_over_ground is not None:
-            self.speed_over_ground = max(0.0, min(102.2, self.speed_over_ground))
+        speed = self.speed_over_ground
+        if speed is not None and not (0.0 <= speed <= 102.2):
+            object.__setattr__(self, "speed_over_ground", max(0.0, min(102.2, speed)))
 
         # Normalize course (0-360)
-        if self.course_over_ground is not None:
-            self.course_over_ground = self.course_over_ground % 360
+        course = self.course_over_ground
+        if course is not None and not (0 <= course < 360):
+            object.__setattr__(self, "course_over_ground", course % 360)
 
         # Normalize heading (0-359)
-        if self.heading is not None:
-            self.heading = self.heading % 360
+        heading = self.heading
+        if heading is not None and not (0 <= heading < 360):
+            object.__setattr__(self, "heading", heading % 360)
 
         # Clamp source quality
-        self.source_quality = max(0.0, min(1.0, self.source_quality))
+        if not (0.0 <= self.source_quality <= 1.0):
+            object.__setattr__(
+                self, "source_quality", max(0.0, min(1.0, self.source_quality))
+            )
 
     @property
     def position(self) -> Position:
         """Get position as Position object."""
-        return Position(self.latitude, self.longitude)
+        if self._position is None:
+            object.__setattr__(self, "_position", Position(self.latitude, self.longitude))
+        return self._position
 
     @property
     def is_moving(self) -> bool:
@@ -272,7 +305,29 @@ class AISMessage:
     @property
     def mmsi_str(self) -> str:
         """Get MMSI as 9-digit string."""
-        return f"{self.mmsi:09d}"
+        if self._mmsi_str is None:
+            object.__setattr__(self, "_mmsi_str", f"{self.mmsi:09d}")
+        return self._mmsi_str
+
+    def to_db_tuple(self) -> tuple[Any, ...]:
+        """Return the vessel position row for this message.
+
+        Values follow the parameter order of the processor's position
+        insert: mmsi, timestamp, longitude, latitude, speed, course,
+        heading, navigation_status, rate_of_turn, position_accuracy.
+        """
+        return (
+            self.mmsi,
+            self.timestamp,
+            self.longitude,
+            self.latitude,
+            self.speed_over_ground,
+            self.course_over_ground,
+            self.heading,
+            self.navigation_status.value if self.navigation_status is not None else None,
+            self.rate_of_turn,
+            1 if self.position_accuracy == "H" else 0,
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -334,7 +389,7 @@ class AISMessage:
         if received_at and isinstance(received_at, str):
             received_at = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
         else:
-            received_at = datetime.utcnow()
+            received_at = datetime.now(timezone.utc)
 
         eta = data.get("eta")
         if eta and isinstance(eta, str):
@@ -8,12 +8,13 @@ Provides:
 - Transaction management
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import text, select, update
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,6 +26,49 @@ from app.socketio.serializers import serialize_vessel_from_ais
 
 logger = logging.getLogger(__name__)
 
+# Socket.IO vessel updates in flight at once while broadcasting a batch
+EMIT_CONCURRENCY = 32
+
+# Position insert for asyncpg; parameters follow AISMessage.to_db_tuple().
+# The PostGIS point is built server-side from the raw coordinates. Keep the
+# text constant: asyncpg's per-connection statement cache is keyed on it, so
+# the insert is parsed and planned once per pooled connection, not per batch
+_INSERT_POSITION_SQL = """
+    INSERT INTO ais.vessel_positions
+    (mmsi, timestamp, position, speed, course, heading,
+     navigation_status, rate_of_turn, position_accuracy)
+    VALUES
+    ($1, $2, ST_SetSRID(ST_MakePoint($3, $4), 4326),
+     $5, $6, $7, $8, $9, $10)
+"""
+
+# Vessel columns refreshed from the incoming row when the MMSI exists
+_VESSEL_UPSERT_COLUMNS = (
+    "last_position_time",
+    "last_latitude",
+    "last_longitude",
+    "last_speed",
+    "last_course",
+    "name",
+    "ship_type",
+    "ship_type_text",
+    "call_sign",
+    "imo",
+    "length",
+    "width",
+    "draught",
+    "destination",
+)
+
+# Vessel upsert built once; rows are passed at execution time, so the
+# compiled form is cached and SQLAlchemy batches the rows into multi-row
+# VALUES pages (insertmanyvalues) within the bind parameter limit
+_VESSEL_UPSERT = pg_insert(Vessel)
+_VESSEL_UPSERT = _VESSEL_UPSERT.on_conflict_do_update(
+    index_elements=["mmsi"],
+    set_={column: _VESSEL_UPSERT.excluded[column] for column in _VESSEL_UPSERT_COLUMNS},
+)
+
 
 class AISMessageProcessor:
     """Processes AIS messages for storage and vessel updates."""
@@ -39,6 +83,7 @@ class AISMessageProcessor:
         self._vessels_processed = 0
         self._positions_stored = 0
         self._errors = 0
+        self._positions_cached = 0
 
     async def process_message(self, message: AISMessage) -> bool:
         """Process a single AIS message.
@@ -49,31 +94,14 @@ class AISMessageProcessor:
         Returns:
             True if processed successfully
         """
-        try:
-            # Update or create vessel record
-            await self._upsert_vessel(message)
-            self._vessels_processed += 1
-
-            # Store position
-            await self._store_position(message)
-            self._positions_stored += 1
-
-            # Cache position in Redis
-            await self._cache_position(message)
-
-            # Emit real-time update via Socket.IO
-            await self._emit_vessel_update(message)
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to process message for MMSI {message.mmsi}: {e}")
-            self._errors += 1
-            return False
+        return await self._process_messages([message])
 
     async def process_batch(self, messages: list[AISMessage]) -> dict[str, int]:
         """Process a batch of AIS messages.
 
+        Vessel records and positions are written with one statement each
+        per batch rather than per message.
+
         Args:
             messages: List of AIS messages
 
@@ -82,8 +110,7 @@ class AISMessageProcessor:
         """
         start_time = datetime.utcnow()
 
-        for message in messages:
-            await self.process_message(message)
+        await self._process_messages(messages)
 
         elapsed = (datetime.utcnow() - start_time).total_seconds()
 
@@ -91,128 +118,169 @@ class AISMessageProcessor:
             "total_messages": len(messages),
             "vessels_processed": self._vessels_processed,
             "positions_stored": self._positions_stored,
+            "positions_cached": self._positions_cached,
             "errors": self._errors,
             "elapsed_seconds": elapsed,
         }
 
-    async def _upsert_vessel(self, message: AISMessage) -> None:
-        """Update or create vessel record from AIS message.
+    async def _process_messages(self, messages: list[AISMessage]) -> bool:
+        """Store, cache and broadcast a list of AIS messages.
+
+        Args:
+            messages: AIS messages to process
+
+        Returns:
+            True if every message was processed successfully
+        """
+        if not messages:
+            return True
+
+        try:
+            # The latest message per vessel drives its vessel record, cache
+            # entry and broadcast; every message still gets its own position row
+            latest = self._latest_per_vessel(messages)
+
+            await self._upsert_vessels(latest)
+            self._vessels_processed += len(latest)
+
+            await self._store_positions(messages)
+            self._positions_stored += len(messages)
+
+        except Exception as e:
+            logger.error(f"Failed to store batch of {len(messages)} AIS messages: {e}")
+            self._errors += len(messages)
+            return False
+
+        # Cache positions in Redis; earlier reports of a vessel would only be
+        # overwritten by its latest one
+        await self._cache_positions(latest)
+
+        # Emit real-time updates via Socket.IO, one per vessel
+        await self._emit_vessel_updates(latest)
+
+        return True
+
+    @staticmethod
+    def _latest_per_vessel(messages: list[AISMessage]) -> list[AISMessage]:
+        """Keep the most recent message of each vessel.
+
+        Args:
+            messages: AIS messages, possibly several per MMSI
+
+        Returns:
+            One message per MMSI, the one with the latest timestamp
+        """
+        latest: dict[int, AISMessage] = {}
+        for message in messages:
+            current = latest.get(message.mmsi)
+            if current is None or message.timestamp >= current.timestamp:
+                latest[message.mmsi] = message
+        return list(latest.values())
+
+    @staticmethod
+    def _vessel_row(message: AISMessage) -> dict[str, Any]:
+        """Build the vessel record values for an AIS message.
+
+        Every row carries the same keys so rows can share one multi-row
+        VALUES page; static data missing from the message is stored as NULL.
+        Numeric columns take plain floats, which the driver encodes and
+        PostgreSQL rounds to the column scale.
 
         Args:
             message: AIS message with vessel data
+
+        Returns:
+            Column values keyed by column name
         """
-        # Build vessel data from message
-        vessel_data = {
-            "mmsi": str(message.mmsi),
+        return {
+            "mmsi": message.mmsi,
             "last_position_time": message.timestamp,
-            "last_latitude": Decimal(str(message.latitude)),
-            "last_longitude": Decimal(str(message.longitude)),
-            "last_speed": Decimal(str(message.speed_over_ground)) if message.speed_over_ground else None,
-            "last_course": Decimal(str(message.course_over_ground)) if message.course_over_ground else None,
+            "last_latitude": message.latitude,
+            "last_longitude": message.longitude,
+            "last_speed": message.speed_over_ground,
+            "last_course": message.course_over_ground,
+            "name": message.vessel_name or None,
+            "ship_type": message.vessel_type_code or None,
+            "ship_type_text": message.vessel_type.display_text if message.vessel_type else None,
+            "call_sign": message.call_sign or None,
+            "imo": str(message.imo_number) if message.imo_number else None,
+            "length": int(message.length) if message.length else None,
+            "width": int(message.width) if message.width else None,
+            "draught": message.draft or None,
+            "destination": message.destination or None,
         }
 
-        # Add optional static data if present
-        if message.vessel_name:
-            vessel_data["name"] = message.vessel_name
-        if message.vessel_type_code:
-            vessel_data["ship_type"] = message.vessel_type_code
-        if message.vessel_type:
-            vessel_data["ship_type_text"] = message.vessel_type.display_text
-        if message.call_sign:
-            vessel_data["call_sign"] = message.call_sign
-        if message.imo_number:
-            vessel_data["imo"] = str(message.imo_number)
-        if message.length:
-            vessel_data["length"] = int(message.length)
-        if message.width:
-            vessel_data["width"] = int(message.width)
-        if message.draft:
-            vessel_data["draught"] = Decimal(str(message.draft))
-        if message.destination:
-            vessel_data["destination"] = message.destination
-
-        # Upsert vessel record
-        stmt = pg_insert(Vessel).values(**vessel_data)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["mmsi"],
-            set_={
-                "last_position_time": stmt.excluded.last_position_time,
-                "last_latitude": stmt.excluded.last_latitude,
-                "last_longitude": stmt.excluded.last_longitude,
-                "last_speed": stmt.excluded.last_speed,
-                "last_course": stmt.excluded.last_course,
-                "name": stmt.excluded.name,
-                "ship_type": stmt.excluded.ship_type,
-                "ship_type_text": stmt.excluded.ship_type_text,
-                "call_sign": stmt.excluded.call_sign,
-                "imo": stmt.excluded.imo,
-                "length": stmt.excluded.length,
-                "width": stmt.excluded.width,
-                "draught": stmt.excluded.draught,
-                "destination": stmt.excluded.destination,
-            },
+    async def _upsert_vessels(self, messages: list[AISMessage]) -> None:
+        """Update or create vessel records from AIS messages.
+
+        Args:
+            messages: AIS messages with vessel data, at most one per MMSI
+        """
+        await self.session.execute(
+            _VESSEL_UPSERT,
+            [self._vessel_row(message) for message in messages],
         )
 
-        await self.session.execute(stmt)
+    async def _store_positions(self, messages: list[AISMessage]) -> None:
+        """Store vessel positions from AIS messages.
 
-    async def _store_position(self, message: AISMessage) -> None:
-        """Store vessel position from AIS message.
+        Rows go to asyncpg's executemany as plain tuples on the session's
+        own connection, skipping SQLAlchemy's per-row parameter handling.
+        The driver transaction is opened by the vessel upsert, which always
+        runs first, so the inserts commit or roll back with the session.
 
         Args:
-            message: AIS message with position data
+            messages: AIS messages with position data
         """
-        # Create PostGIS point from coordinates
-        point_wkt = f"SRID=4326;POINT({message.longitude} {message.latitude})"
-
-        # Insert position record using raw SQL for PostGIS
-        stmt = text("""
-            INSERT INTO ais.vessel_positions
-            (mmsi, timestamp, position, latitude, longitude, speed, course, heading,
-             navigation_status, rate_of_turn, position_accuracy)
-            VALUES
-            (:mmsi, :timestamp, ST_GeogFromText(:position), :latitude, :longitude,
-             :speed, :course, :heading, :navigation_status, :rate_of_turn, :position_accuracy)
-        """)
-
-        await self.session.execute(
-            stmt,
-            {
-                "mmsi": str(message.mmsi),
-                "timestamp": message.timestamp,
-                "position": point_wkt,
-                "latitude": message.latitude,
-                "longitude": message.longitude,
-                "speed": message.speed_over_ground,
-                "course": message.course_over_ground,
-                "heading": message.heading,
-                "navigation_status": (
-                    message.navigation_status.value if message.navigation_status else None
-                ),
-                "rate_of_turn": message.rate_of_turn,
-                "position_accuracy": 1 if message.position_accuracy == "H" else 0,
-            },
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.executemany(
+            _INSERT_POSITION_SQL,
+            [message.to_db_tuple() for message in messages],
         )
 
-    async def _cache_position(self, message: AISMessage) -> None:
-        """Cache vessel position in Redis.
+    async def _cache_positions(self, messages: list[AISMessage]) -> None:
+        """Cache vessel positions in Redis with one pipelined round trip.
 
         Args:
-            message: AIS message with position data
+            messages: AIS messages with position data
         """
         redis_client = get_redis_client()
         if not redis_client:
             return
 
-        await redis_client.set_vessel_position(
-            mmsi=message.mmsi,
-            latitude=message.latitude,
-            longitude=message.longitude,
-            speed=message.speed_over_ground,
-            course=message.course_over_ground,
-            heading=message.heading,
-            timestamp=message.timestamp,
+        self._positions_cached += await redis_client.set_vessel_positions_batch(
+            [
+                {
+                    "mmsi": message.mmsi,
+                    "latitude": message.latitude,
+                    "longitude": message.longitude,
+                    "speed": message.speed_over_ground,
+                    "course": message.course_over_ground,
+                    "heading": message.heading,
+                    "timestamp": message.timestamp.isoformat(),
+                }
+                for message in messages
+            ]
         )
 
+    async def _emit_vessel_updates(self, messages: list[AISMessage]) -> None:
+        """Emit vessel updates for a batch concurrently.
+
+        At most EMIT_CONCURRENCY emits are awaited at a time, so the Redis
+        publishes behind them overlap without flooding the connection pool.
+
+        Args:
+            messages: AIS messages with position data
+        """
+        semaphore = asyncio.Semaphore(EMIT_CONCURRENCY)
+
+        async def emit(message: AISMessage) -> None:
+            async with semaphore:
+                await self._emit_vessel_update(message)
+
+        await asyncio.gather(*(emit(message) for message in messages))
+
     async def _emit_vessel_update(self, message: AISMessage) -> None:
         """Emit vessel update via Socket.IO.
 
@@ -277,9 +345,80 @@ async def process_ais_messages(
 
 # ==================== Risk Score Calculation ====================
 
+# Flag states with a higher risk of irregular registration
+_HIGH_RISK_FLAGS = frozenset({"XX", "PA", "MH", "LR", "KM", "VU"})
+
+# Time without a position report after which a moving vessel may be dark
+_AIS_GAP_THRESHOLD = timedelta(minutes=30)
+
+# AIS ship type codes for cargo (70-79) and tanker (80-89) vessels
+_CARGO_TANKER_RANGE = range(70, 90)
+
+# Risk scoring in SQL: sums the risk factors of the selected vessels, caps
+# the score at 100 and derives the category. {vessel_filter} selects the
+# vessels to score
+_RISK_SCORE_UPDATE_SQL = """
+    UPDATE ais.vessels AS v
+    SET risk_score = s.score,
+        risk_category = CASE
+            WHEN s.score >= 75 THEN 'critical'
+            WHEN s.score >= 50 THEN 'high'
+            WHEN s.score >= 25 THEN 'medium'
+            ELSE 'low'
+        END
+    FROM (
+        SELECT mmsi, LEAST(100,
+            -- Flag state risk (certain flag states have higher risk)
+            CASE WHEN upper(flag_state) = ANY(:high_risk_flags) THEN 15 ELSE 0 END
+            -- Unknown flag state
+            + CASE WHEN coalesce(flag_state, '') IN ('', 'XX') THEN 10 ELSE 0 END
+            -- Missing vessel name
+            + CASE WHEN coalesce(trim(name), '') = '' THEN 10 ELSE 0 END
+            -- Suspicious vessel type
+            + CASE WHEN strpos(lower(ship_type_text), 'unknown') > 0 THEN 10 ELSE 0 END
+            -- AIS gap while moving (potential dark vessel)
+            + CASE WHEN last_position_time < :gap_cutoff AND last_speed > 1
+                THEN 25 ELSE 0 END
+            -- Cargo/tanker vessels rarely exceed 20 knots
+            + CASE WHEN ship_type BETWEEN :cargo_tanker_first AND :cargo_tanker_last
+                AND last_speed > 20 THEN 15 ELSE 0 END
+        ) AS score
+        FROM ais.vessels
+        WHERE {vessel_filter}
+    ) AS s
+    WHERE v.mmsi = s.mmsi
+"""
+
+_UPDATE_VESSEL_RISK_SCORE = text(
+    _RISK_SCORE_UPDATE_SQL.format(vessel_filter="mmsi = :mmsi") + "RETURNING v.risk_score"
+)
+
+_UPDATE_ALL_RISK_SCORES = text(
+    _RISK_SCORE_UPDATE_SQL.format(vessel_filter="last_position_time >= :cutoff")
+)
+
+
+def _risk_score_params(now: datetime) -> dict[str, Any]:
+    """Bind parameters shared by the risk score updates.
+
+    Args:
+        now: Current time as an aware UTC datetime; last_position_time is
+            TIMESTAMPTZ, and a naive value would be read as server-local time
+
+    Returns:
+        Parameter dictionary
+    """
+    return {
+        "high_risk_flags": sorted(_HIGH_RISK_FLAGS),
+        "gap_cutoff": now - _AIS_GAP_THRESHOLD,
+        "cargo_tanker_first": _CARGO_TANKER_RANGE[0],
+        "cargo_tanker_last": _CARGO_TANKER_RANGE[-1],
+    }
+
+
 async def calculate_vessel_risk_score(
     session: AsyncSession,
-    mmsi: str,
+    mmsi: int,
 ) -> Optional[Decimal]:
     """Calculate risk score for a vessel.
 
@@ -290,6 +429,9 @@ async def calculate_vessel_risk_score(
     - Position history anomalies
     - AIS gaps
 
+    The score is computed and stored by one UPDATE ... RETURNING, so the
+    vessel is never loaded into Python.
+
     Args:
         session: Database session
         mmsi: Vessel MMSI
@@ -297,76 +439,18 @@ async def calculate_vessel_risk_score(
     Returns:
         Calculated risk score (0-100) or None
     """
-    # Get vessel record
     result = await session.execute(
-        select(Vessel).where(Vessel.mmsi == mmsi)
-    )
-    vessel = result.scalar_one_or_none()
-
-    if not vessel:
-        return None
-
-    risk_score = Decimal("0.0")
-
-    # Factor 1: Flag state risk (certain flag states have higher risk)
-    high_risk_flags = {"XX", "PA", "MH", "LR", "KM", "VU"}
-    if vessel.flag_state and vessel.flag_state.upper() in high_risk_flags:
-        risk_score += Decimal("15.0")
-
-    # Factor 2: Unknown flag state
-    if not vessel.flag_state or vessel.flag_state == "XX":
-        risk_score += Decimal("10.0")
-
-    # Factor 3: Missing vessel name
-    if not vessel.name or vessel.name.strip() == "":
-        risk_score += Decimal("10.0")
-
-    # Factor 4: Suspicious vessel type
-    if vessel.ship_type_text and "unknown" in vessel.ship_type_text.lower():
-        risk_score += Decimal("10.0")
-
-    # Factor 5: Check for AIS gaps (no positions in last 30 minutes when moving)
-    if vessel.last_position_time:
-        time_since_update = datetime.utcnow() - vessel.last_position_time
-        if time_since_update > timedelta(minutes=30):
-            # Check if vessel was moving (speed > 1 knot)
-            if vessel.last_speed and vessel.last_speed > Decimal("1.0"):
-                risk_score += Decimal("25.0")  # Potential dark vessel
-
-    # Factor 6: Abnormal speed for vessel type
-    if vessel.last_speed:
-        speed = float(vessel.last_speed)
-        # Cargo/tanker vessels rarely exceed 20 knots
-        if vessel.ship_type in range(70, 90) and speed > 20:
-            risk_score += Decimal("15.0")
-
-    # Cap at 100
-    risk_score = min(risk_score, Decimal("100.0"))
-
-    # Determine category
-    if risk_score >= 75:
-        category = "critical"
-    elif risk_score >= 50:
-        category = "high"
-    elif risk_score >= 25:
-        category = "medium"
-    else:
-        category = "low"
-
-    # Update vessel record
-    await session.execute(
-        update(Vessel)
-        .where(Vessel.mmsi == mmsi)
-        .values(risk_score=risk_score, risk_category=category)
+        _UPDATE_VESSEL_RISK_SCORE,
+        {"mmsi": mmsi, **_risk_score_params(datetime.now(timezone.utc))},
     )
-
-    return risk_score
+    return result.scalar_one_or_none()
 
 
 async def update_all_risk_scores(session: AsyncSession) -> dict[str, int]:
     """Update risk scores for all active vessels.
 
-    Active vessels are those seen in the last hour.
+    Active vessels are those seen in the last hour. All of them are scored
+    by a single UPDATE.
 
     Args:
         session: Database session
@@ -374,27 +458,21 @@ async def update_all_risk_scores(session: AsyncSession) -> dict[str, int]:
     Returns:
         Statistics dictionary
     """
-    cutoff_time = datetime.utcnow() - timedelta(hours=1)
-
-    # Get active vessels
-    result = await session.execute(
-        select(Vessel.mmsi).where(Vessel.last_position_time >= cutoff_time)
-    )
-    mmsis = [row[0] for row in result.fetchall()]
+    now = datetime.now(timezone.utc)
 
-    updated = 0
-    errors = 0
+    try:
+        result = await session.execute(
+            _UPDATE_ALL_RISK_SCORES,
+            {"cutoff": now - timedelta(hours=1), **_risk_score_params(now)},
+        )
+    except Exception as e:
+        logger.error(f"Failed to update risk scores: {e}")
+        return {"total_vessels": 0, "updated": 0, "errors": 1}
 
-    for mmsi in mmsis:
-        try:
-            await calculate_vessel_risk_score(session, mmsi)
-            updated += 1
-        except Exception as e:
-            logger.error(f"Failed to update risk score for {mmsi}: {e}")
-            errors += 1
+    updated = result.rowcount
 
     return {
-        "total_vessels": len(mmsis),
+        "total_vessels": updated,
         "updated": updated,
-        "errors": errors,
+        "errors": 0,
     }
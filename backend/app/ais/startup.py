@@ -6,13 +6,21 @@ Provides:
 - Manager setup and lifecycle management
 """
 
+import asyncio
+import copy
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from app.ais.adapters.base import AISDataAdapter
 from app.ais.manager import AISAdapterManager, set_ais_manager, get_ais_manager
 from app.ais.models import BoundingBox
@@ -33,6 +41,48 @@ DEFAULT_BBOX = BoundingBox(
 # Default scenario for development
 DEFAULT_DEVELOPMENT_SCENARIO = "thessaloniki_normal_traffic"
 
+# Backend and project (poseidon-mss) directories, computed once;
+# startup.py is at backend/app/ais/startup.py
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+PROJECT_ROOT = BACKEND_ROOT.parent
+
+# Scenario directory locations, in order of preference
+_SCENARIO_DIR_CANDIDATES = [
+    # Docker container path (scenarios mounted at /app/scenarios)
+    "/app/scenarios",
+    # Absolute path from project root (for local development)
+    str(PROJECT_ROOT / "scenarios"),
+    # From backend directory
+    os.path.abspath("../scenarios"),
+    # From project root
+    os.path.abspath("scenarios"),
+    # Alternative: backend/scenarios (if scenarios are copied there)
+    str(BACKEND_ROOT / "scenarios"),
+]
+
+
+def _find_scenarios_dir() -> Optional[str]:
+    """Return the first existing scenarios directory, or None."""
+    for candidate in _SCENARIO_DIR_CANDIDATES:
+        if os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+# Probed once at import; the directory layout is fixed for the process
+_SCENARIOS_DIR = _find_scenarios_dir()
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file.
+
+    mtime_ns is only part of the cache key, so an edited file is parsed
+    again. The result is shared; callers must not mutate it.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 def load_ais_config(config_path: Optional[str] = None) -> dict[str, Any]:
     """Load AIS configuration from YAML file.
@@ -48,20 +98,25 @@ def load_ais_config(config_path: Optional[str] = None) -> dict[str, Any]:
         config_path,
         "config/ais_sources.yaml",
         "../config/ais_sources.yaml",
-        Path(__file__).parent.parent.parent / "config" / "ais_sources.yaml",
+        BACKEND_ROOT / "config" / "ais_sources.yaml",
     ]
 
     for path in search_paths:
-        if path and Path(path).exists():
+        if path and os.path.isfile(path):
             logger.info(f"Loading AIS config from: {path}")
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
+            path = os.path.abspath(path)
+            # Each caller gets its own copy of the cached data
+            return copy.deepcopy(_read_yaml(path, os.stat(path).st_mtime_ns))
 
     # Return default config if no file found
     logger.info("No AIS config file found, using defaults")
     return get_default_config()
 
 
+# Drops every cached config file; see reinitialize_ais_adapters(force=True)
+load_ais_config.cache_clear = _read_yaml.cache_clear
+
+
 def get_default_config() -> dict[str, Any]:
     """Get default AIS configuration based on environment.
 
@@ -70,37 +125,26 @@ def get_default_config() -> dict[str, Any]:
     """
     environment = settings.environment
 
-    # Find scenario file - search multiple locations
+    # Find scenario file in the scenarios directory
     scenario_file = None
     scenario_filename = f"{DEFAULT_DEVELOPMENT_SCENARIO}.yaml"
 
-    # Get the project root (poseidon-mss directory)
-    # startup.py is at: backend/app/ais/startup.py
-    project_root = Path(__file__).parent.parent.parent.parent
-
-    scenario_paths = [
-        # Docker container path (scenarios mounted at /app/scenarios)
-        Path("/app/scenarios") / scenario_filename,
-        # Absolute path from project root (for local development)
-        project_root / "scenarios" / scenario_filename,
-        # From backend directory
-        Path("../scenarios") / scenario_filename,
-        # From project root
-        Path("scenarios") / scenario_filename,
-        # Alternative: backend/scenarios (if scenarios are copied there)
-        Path(__file__).parent.parent.parent / "scenarios" / scenario_filename,
-    ]
-
-    for path in scenario_paths:
-        resolved = path.resolve() if hasattr(path, 'resolve') else Path(path).resolve()
-        logger.debug(f"Checking scenario path: {resolved}")
-        if resolved.exists():
-            scenario_file = str(resolved)
+    if _SCENARIOS_DIR is not None:
+        # One directory listing instead of a stat per candidate path
+        try:
+            with os.scandir(_SCENARIOS_DIR) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            names = set()
+        if scenario_filename in names:
+            scenario_file = os.path.join(_SCENARIOS_DIR, scenario_filename)
             logger.info(f"Found scenario file: {scenario_file}")
-            break
 
     if not scenario_file:
-        logger.warning(f"Scenario file not found. Searched paths: {[str(p) for p in scenario_paths]}")
+        logger.warning(
+            f"Scenario file {scenario_filename} not found. "
+            f"Searched directories: {_SCENARIO_DIR_CANDIDATES}"
+        )
 
     if environment in ("development", "testing"):
         return {
@@ -197,8 +241,8 @@ async def initialize_ais_adapters(
     """
     logger.info(f"Initializing AIS adapters for environment: {settings.environment}")
 
-    # Load configuration
-    config = load_ais_config(config_path)
+    # Load configuration; the YAML parse runs off the event loop
+    config = await asyncio.to_thread(load_ais_config, config_path)
 
     # Create adapters
     adapters = []
@@ -249,11 +293,13 @@ async def shutdown_ais_adapters() -> None:
 
 async def reinitialize_ais_adapters(
     config_path: Optional[str] = None,
+    force: bool = False,
 ) -> Optional[AISAdapterManager]:
     """Reinitialize AIS adapters with new configuration.
 
     Args:
         config_path: Optional path to config file
+        force: Re-read the config file even if it is unchanged
 
     Returns:
         New AISAdapterManager or None
@@ -261,5 +307,12 @@ async def reinitialize_ais_adapters(
     # Shutdown existing
     await shutdown_ais_adapters()
 
+    # Reconfiguration starts from freshly probed and parsed scenario files
+    from app.emulator.scenarios import clear_scenario_cache, invalidate_scenarios_dir
+    invalidate_scenarios_dir()
+    clear_scenario_cache()
+    if force:
+        load_ais_config.cache_clear()
+
     # Initialize new
     return await initialize_ais_adapters(config_path)
@@ -7,15 +7,12 @@ Provides endpoints for:
 """
 
 import logging
-from pathlib import Path
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from app.ais import get_ais_manager, BoundingBox
-from app.ais.adapters.emulator import EmulatorAdapter
-from app.emulator.scenarios import list_scenarios, get_scenario_info, load_scenario
 
 logger = logging.getLogger(__name__)
 
@@ -126,37 +123,6 @@ async def check_sources_health() -> dict[str, bool]:
     return await manager.health_check_all()
 
 
-def get_scenarios_dir() -> Path:
-    """Get the scenarios directory, checking multiple possible locations.
-
-    Returns:
-        Path to scenarios directory
-    """
-    # Check Docker path first (when mounted at /app/scenarios)
-    docker_path = Path("/app/scenarios")
-    if docker_path.exists():
-        logger.debug(f"Using Docker scenarios path: {docker_path}")
-        return docker_path
-
-    # Check relative path from working directory
-    relative_path = Path("scenarios")
-    if relative_path.exists():
-        logger.debug(f"Using relative scenarios path: {relative_path.resolve()}")
-        return relative_path
-
-    # Check relative to this file's location (for local development)
-    # ais_routes.py is at: backend/app/api/ais_routes.py
-    # scenarios is at: scenarios/
-    local_path = Path(__file__).parent.parent.parent.parent / "scenarios"
-    if local_path.exists():
-        logger.debug(f"Using local development scenarios path: {local_path}")
-        return local_path
-
-    # Default to relative path (may not exist)
-    logger.warning(f"Scenarios directory not found. Checked: /app/scenarios, scenarios, {local_path}")
-    return relative_path
-
-
 @router.get("/emulator/scenarios", response_model=ScenarioListResponse)
 async def list_emulator_scenarios() -> ScenarioListResponse:
     """List available emulator scenarios.
@@ -164,6 +130,8 @@ async def list_emulator_scenarios() -> ScenarioListResponse:
     Returns:
         List of scenario metadata
     """
+    from app.emulator.scenarios import get_scenario_info, get_scenarios_dir, list_scenarios
+
     scenarios_dir = get_scenarios_dir()
 
     scenario_names = list_scenarios(scenarios_dir)
@@ -251,6 +219,9 @@ async def _load_scenario(scenario_name: str, clear_existing: bool = True) -> dic
     Raises:
         HTTPException: On various error conditions
     """
+    from app.ais.adapters.emulator import EmulatorAdapter
+    from app.emulator.scenarios import get_scenarios_dir
+
     manager = get_ais_manager()
 
     if manager is None:
@@ -281,14 +252,16 @@ async def _load_scenario(scenario_name: str, clear_existing: bool = True) -> dic
             )
 
     try:
+        # Load scenario in the backend's emulator first: it is prepared and
+        # swapped in without interrupting fetches, and if it fails the
+        # database is left as it was
+        await adapter.load_scenario(str(scenario_path))
+
         # Clear existing vessels from database if requested
         if clear_existing:
             await _clear_vessel_data()
             logger.info("Cleared existing vessel data from database")
 
-        # Load scenario in the backend's emulator
-        await adapter.load_scenario(str(scenario_path))
-
         # Also trigger the Celery worker to reload the scenario
         # This ensures the worker's emulator (which feeds the DB) is in sync
         try:
@@ -313,12 +286,18 @@ async def _clear_vessel_data() -> None:
     This is used when loading a new scenario to remove old vessels.
     """
     from sqlalchemy import text
+    from app.config import get_settings
     from app.database.connection import get_async_session
 
     async with get_async_session() as session:
         # Delete positions first (foreign key constraint)
-        await session.execute(text("DELETE FROM ais.vessel_positions"))
-        # Then delete vessels
+        if get_settings().allow_truncate_on_scenario_reload:
+            # Nothing references vessel_positions, so no CASCADE is needed
+            await session.execute(text("TRUNCATE ais.vessel_positions RESTART IDENTITY"))
+        else:
+            await session.execute(text("DELETE FROM ais.vessel_positions"))
+        # Then delete vessels; a DELETE keeps ON DELETE SET NULL on alerts,
+        # where TRUNCATE ... CASCADE would empty the alert tables too
         await session.execute(text("DELETE FROM ais.vessels"))
         await session.commit()
         logger.info("Cleared vessel_positions and vessels tables")
@@ -331,6 +310,8 @@ async def get_emulator_stats() -> EmulatorStatsResponse:
     Returns:
         Emulator statistics
     """
+    from app.ais.adapters.emulator import EmulatorAdapter
+
     manager = get_ais_manager()
 
     if manager is None:
@@ -360,6 +341,8 @@ async def add_emulator_vessel(vessel_config: dict[str, Any]) -> dict[str, str]:
     Returns:
         Success message
     """
+    from app.ais.adapters.emulator import EmulatorAdapter
+
     manager = get_ais_manager()
 
     if manager is None:
@@ -407,6 +390,8 @@ async def remove_emulator_vessel(mmsi: int) -> dict[str, str]:
     Returns:
         Success message
     """
+    from app.ais.adapters.emulator import EmulatorAdapter
+
     manager = get_ais_manager()
 
     if manager is None:
@@ -440,6 +425,8 @@ async def get_emulator_vessels() -> dict[str, list[dict[str, Any]]]:
     Returns:
         List of current vessel states
     """
+    from app.ais.adapters.emulator import EmulatorAdapter
+
     manager = get_ais_manager()
 
     if manager is None:
@@ -3,17 +3,20 @@
 Main API router that combines all route modules.
 """
 
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, desc, and_
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, Select, select, desc, and_
 
 from app.api.ais_routes import router as ais_router
 from app.api.v1 import router as v1_router
-from app.database.connection import get_async_db
+from app.database.connection import get_async_session
 from app.models.risk_alert import RiskAlert
 
 logger = logging.getLogger(__name__)
@@ -27,19 +30,44 @@ router.include_router(v1_router)
 router.include_router(ais_router)
 
 
-@router.get("/alerts")
+# Columns read by GET /alerts
+_ALERT_COLUMNS = (
+    RiskAlert.id,
+    RiskAlert.alert_type,
+    RiskAlert.severity,
+    RiskAlert.status,
+    RiskAlert.title,
+    RiskAlert.message,
+    RiskAlert.vessel_mmsi,
+    RiskAlert.secondary_vessel_mmsi,
+    RiskAlert.latitude,
+    RiskAlert.longitude,
+    RiskAlert.details,
+    RiskAlert.risk_score,
+    RiskAlert.acknowledged,
+    RiskAlert.acknowledged_at,
+    RiskAlert.resolved,
+    RiskAlert.resolved_at,
+    RiskAlert.created_at,
+    RiskAlert.updated_at,
+)
+
+
+@router.get("/alerts", response_class=StreamingResponse)
 async def get_alerts(
-    db: AsyncSession = Depends(get_async_db),
     status: Optional[str] = Query(None, description="Filter by status (active, acknowledged, resolved)"),
     severity: Optional[str] = Query(None, description="Filter by severity (info, warning, alert, critical)"),
     alert_type: Optional[str] = Query(None, description="Filter by alert type (collision_risk, zone_entry, etc.)"),
     hours: int = Query(24, description="Get alerts from last N hours", ge=1, le=168),
     limit: int = Query(100, description="Maximum number of alerts", ge=1, le=500),
-) -> dict[str, list]:
+) -> StreamingResponse:
     """Get alerts with optional filtering.
 
+    The body is streamed as rows arrive from the database, so the full
+    result set is never held in memory. The stream uses its own session:
+    request dependencies are closed before a streaming body is sent.
+
     Args:
-        db: Database session
         status: Filter by status
         severity: Filter by severity level
         alert_type: Filter by alert type
@@ -47,58 +75,96 @@ async def get_alerts(
         limit: Maximum results
 
     Returns:
-        Dictionary with alerts list
+        JSON object with an "alerts" list
     """
-    try:
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        # Build query
-        conditions = [RiskAlert.created_at >= cutoff_time]
-
-        if status:
-            conditions.append(RiskAlert.status == status)
-        if severity:
-            conditions.append(RiskAlert.severity == severity)
-        if alert_type:
-            conditions.append(RiskAlert.alert_type == alert_type)
-
-        query = (
-            select(RiskAlert)
-            .where(and_(*conditions))
-            .order_by(desc(RiskAlert.created_at))
-            .limit(limit)
-        )
-
-        result = await db.execute(query)
-        alerts = result.scalars().all()
-
-        # Convert to response format
-        alert_list = []
-        for alert in alerts:
-            alert_list.append({
-                "id": str(alert.id),
-                "type": alert.alert_type,
-                "typeText": alert.alert_type_text,
-                "severity": alert.severity,
-                "status": alert.status,
-                "title": alert.title,
-                "message": alert.message,
-                "vesselMmsi": alert.vessel_mmsi,
-                "secondaryVesselMmsi": alert.secondary_vessel_mmsi,
-                "latitude": float(alert.latitude) if alert.latitude else None,
-                "longitude": float(alert.longitude) if alert.longitude else None,
-                "details": alert.details,
-                "riskScore": float(alert.risk_score) if alert.risk_score else None,
-                "acknowledged": alert.acknowledged,
-                "acknowledgedAt": alert.acknowledged_at.isoformat() if alert.acknowledged_at else None,
-                "resolved": alert.resolved,
-                "resolvedAt": alert.resolved_at.isoformat() if alert.resolved_at else None,
-                "createdAt": alert.created_at.isoformat() if alert.created_at else None,
-                "updatedAt": alert.updated_at.isoformat() if alert.updated_at else None,
-            })
-
-        return {"alerts": alert_list}
+    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+    # Build query
+    conditions = [RiskAlert.created_at >= cutoff_time]
+
+    if status:
+        conditions.append(RiskAlert.status == status)
+    if severity:
+        conditions.append(RiskAlert.severity == severity)
+    if alert_type:
+        conditions.append(RiskAlert.alert_type == alert_type)
+
+    # Column query: rows come back as plain tuples, skipping ORM
+    # instance construction and identity-map bookkeeping
+    query = (
+        select(*_ALERT_COLUMNS)
+        .where(and_(*conditions))
+        .order_by(desc(RiskAlert.created_at))
+        .limit(limit)
+    )
 
+    return StreamingResponse(_stream_alerts(query), media_type="application/json")
+
+
+async def _stream_alerts(query: Select) -> AsyncIterator[bytes]:
+    """Yield the JSON body of GET /alerts one alert at a time.
+
+    A database error ends the list early instead of breaking the JSON; an
+    error before the first row therefore yields {"alerts": []}.
+    """
+    yield b'{"alerts":['
+    try:
+        async with get_async_session() as session:
+            result = await session.stream(query)
+            first = True
+            async for row in result:
+                chunk = _encode_alert(_alert_to_dict(row)).encode()
+                yield chunk if first else b"," + chunk
+                first = False
     except Exception as e:
         logger.error(f"Error fetching alerts: {e}")
-        return {"alerts": []}
+    yield b"]}"
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode the non-JSON column types of an alert row."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Alert encoder built once: compact separators, and no circular-reference
+# tracking since rows are flat. Datetimes, Decimals and UUIDs go through
+# _encode_default, which spares the per-field conversion branches
+_encode_alert = json.JSONEncoder(
+    separators=(",", ":"),
+    check_circular=False,
+    default=_encode_default,
+).encode
+
+
+def _alert_to_dict(row: Row) -> dict[str, Any]:
+    """Convert a row of _ALERT_COLUMNS to the response format.
+
+    Values are left in their column types; _encode_alert converts them.
+    """
+    return {
+        "id": row.id,
+        "type": row.alert_type,
+        "typeText": RiskAlert.type_text(row.alert_type),
+        "severity": row.severity,
+        "status": row.status,
+        "title": row.title,
+        "message": row.message,
+        "vesselMmsi": str(row.vessel_mmsi) if row.vessel_mmsi else None,
+        "secondaryVesselMmsi": str(row.secondary_vessel_mmsi) if row.secondary_vessel_mmsi else None,
+        "latitude": row.latitude or None,
+        "longitude": row.longitude or None,
+        "details": row.details,
+        "riskScore": row.risk_score or None,
+        "acknowledged": row.acknowledged,
+        "acknowledgedAt": row.acknowledged_at,
+        "resolved": row.resolved,
+        "resolvedAt": row.resolved_at,
+        "createdAt": row.created_at,
+        "updatedAt": row.updated_at,
+    }
@@ -218,7 +218,7 @@ async def get_vessels(
         for vessel in vessels:
             vessel_responses.append(
                 VesselResponse(
-                    mmsi=vessel.mmsi,
+                    mmsi=str(vessel.mmsi),
                     imo=vessel.imo,
                     name=vessel.name,
                     call_sign=vessel.call_sign,
@@ -305,10 +305,11 @@ async def get_vessel(
                 status_code=400,
                 detail="MMSI must be a 9-digit number",
             )
+        vessel_mmsi = int(mmsi)
 
         # Query vessel
         result = await db.execute(
-            select(Vessel).where(Vessel.mmsi == mmsi)
+            select(Vessel).where(Vessel.mmsi == vessel_mmsi)
         )
         vessel = result.scalar_one_or_none()
 
@@ -323,7 +324,7 @@ async def get_vessel(
         if vessel.last_position_time:
             pos_result = await db.execute(
                 select(VesselPosition.heading)
-                .where(VesselPosition.mmsi == mmsi)
+                .where(VesselPosition.mmsi == vessel_mmsi)
                 .order_by(desc(VesselPosition.timestamp))
                 .limit(1)
             )
@@ -332,7 +333,7 @@ async def get_vessel(
                 heading = pos
 
         return VesselResponse(
-            mmsi=vessel.mmsi,
+            mmsi=str(vessel.mmsi),
             imo=vessel.imo,
             name=vessel.name,
             call_sign=vessel.call_sign,
@@ -435,17 +436,18 @@ async def get_vessel_track(
                 status_code=400,
                 detail="MMSI must be a 9-digit number",
             )
+        vessel_mmsi = int(mmsi)
 
         # Check vessel exists
         vessel_result = await db.execute(
-            select(Vessel.name).where(Vessel.mmsi == mmsi)
+            select(Vessel.name).where(Vessel.mmsi == vessel_mmsi)
         )
         vessel_name = vessel_result.scalar_one_or_none()
 
         if vessel_name is None:
             # Check if any positions exist for this MMSI
             pos_check = await db.execute(
-                select(func.count()).select_from(VesselPosition).where(VesselPosition.mmsi == mmsi)
+                select(func.count()).select_from(VesselPosition).where(VesselPosition.mmsi == vessel_mmsi)
             )
             if pos_check.scalar() == 0:
                 raise HTTPException(
@@ -471,7 +473,7 @@ async def get_vessel_track(
             select(VesselPosition)
             .where(
                 and_(
-                    VesselPosition.mmsi == mmsi,
+                    VesselPosition.mmsi == vessel_mmsi,
                     VesselPosition.timestamp >= start_time,
                     VesselPosition.timestamp <= end_time,
                 )
@@ -494,7 +496,7 @@ async def get_vessel_track(
             # Add to positions list
             position_responses.append(
                 VesselPositionResponse(
-                    mmsi=pos.mmsi,
+                    mmsi=str(pos.mmsi),
                     timestamp=pos.timestamp,
                     latitude=float(pos.latitude),
                     longitude=float(pos.longitude),
@@ -297,7 +297,10 @@ class RedisClient:
             return 0
 
         try:
-            pipe = self._client.pipeline()
+            # No MULTI/EXEC: the writes are independent, only the round trip
+            # needs to be shared
+            pipe = self._client.pipeline(transaction=False)
+            cached_at = datetime.utcnow().isoformat()
 
             for pos in positions:
                 mmsi = pos.get("mmsi")
@@ -305,7 +308,7 @@ class RedisClient:
                     continue
 
                 key = f"{VESSEL_POSITION_PREFIX}{mmsi}"
-                pos["cached_at"] = datetime.utcnow().isoformat()
+                pos["cached_at"] = cached_at
                 pipe.setex(key, ttl, json.dumps(pos))
 
             await pipe.execute()
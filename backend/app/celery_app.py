@@ -169,6 +169,11 @@ def init_worker_process(**kwargs):
         manager = loop.run_until_complete(_init())
         _worker_ais_initialized = manager is not None
 
+        # Collision detection runs in this process every 30 seconds; load
+        # and exercise its kernel now rather than in the first cycle
+        from app.ais._collision_kernel import warm_up
+        warm_up()
+
         logger.info("Celery worker process initialized successfully")
 
     except Exception as e:
@@ -37,6 +37,10 @@ class Settings(BaseSettings):
     celery_broker_url: str = "redis://redis:6379/1"
     celery_result_backend: str = "redis://redis:6379/2"
 
+    # Emulator: empty the position history with TRUNCATE (no per-row delete
+    # or WAL) when a scenario reload clears existing data
+    allow_truncate_on_scenario_reload: bool = True
+
 
 @lru_cache
 def get_settings() -> Settings:
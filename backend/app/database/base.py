@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import MetaData
+from sqlalchemy import DateTime, MetaData
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -22,6 +22,11 @@ class Base(DeclarativeBase):
 
     metadata = MetaData(naming_convention=convention)
 
+    # All timestamps are stored as TIMESTAMPTZ
+    type_annotation_map = {
+        datetime: DateTime(timezone=True),
+    }
+
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary."""
         return {c.name: getattr(self, c.name) for c in self.__table__.columns}
@@ -7,7 +7,7 @@ import asyncio
 import logging
 import random
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
@@ -32,7 +32,7 @@ logger = logging.getLogger(__name__)
 # Sample vessels in the Thessaloniki area
 SAMPLE_VESSELS: list[dict[str, Any]] = [
     {
-        "mmsi": "239876543",
+        "mmsi": 239876543,
         "imo": "9876543",
         "name": "AEGEAN SPIRIT",
         "call_sign": "SVAB1",
@@ -51,7 +51,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "240123456",
+        "mmsi": 240123456,
         "imo": "9123456",
         "name": "POSEIDON CARRIER",
         "call_sign": "SVCD2",
@@ -70,7 +70,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "241567890",
+        "mmsi": 241567890,
         "imo": "9567890",
         "name": "MEDITERRANEAN STAR",
         "call_sign": "SVEF3",
@@ -89,7 +89,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "moderate",
     },
     {
-        "mmsi": "538001234",
+        "mmsi": 538001234,
         "imo": "9234567",
         "name": "OCEAN BREEZE",
         "call_sign": "V7AB4",
@@ -108,7 +108,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "636012345",
+        "mmsi": 636012345,
         "imo": "9345678",
         "name": "LIBERTY EXPRESS",
         "call_sign": "D5GH5",
@@ -127,7 +127,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "255804000",
+        "mmsi": 255804000,
         "imo": "9456789",
         "name": "ATLANTIC VOYAGER",
         "call_sign": "CQIJ6",
@@ -146,7 +146,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "311045000",
+        "mmsi": 311045000,
         "imo": "9567891",
         "name": "CARIBBEAN TRADER",
         "call_sign": "C6KL7",
@@ -165,7 +165,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "moderate",
     },
     {
-        "mmsi": "371234000",
+        "mmsi": 371234000,
         "imo": "9678901",
         "name": "PACIFIC DAWN",
         "call_sign": "HOMN8",
@@ -184,7 +184,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "elevated",
     },
     {
-        "mmsi": "244890000",
+        "mmsi": 244890000,
         "imo": "9789012",
         "name": "DUTCH PIONEER",
         "call_sign": "PBOP9",
@@ -203,7 +203,7 @@ SAMPLE_VESSELS: list[dict[str, Any]] = [
         "risk_category": "low",
     },
     {
-        "mmsi": "269057000",
+        "mmsi": 269057000,
         "imo": "9890123",
         "name": "SWISS LAKE",
         "call_sign": "HBQR0",
@@ -259,7 +259,7 @@ def generate_track_positions(
 ) -> list[dict[str, Any]]:
     """Generate a realistic vessel track with slight variations."""
     positions = []
-    current_time = datetime.utcnow() - timedelta(minutes=num_points * time_interval_minutes)
+    current_time = datetime.now(timezone.utc) - timedelta(minutes=num_points * time_interval_minutes)
 
     lat = base_lat
     lon = base_lon
@@ -283,8 +283,8 @@ def generate_track_positions(
 
         positions.append({
             "timestamp": current_time,
-            "latitude": Decimal(str(round(lat + lat_variation, 6))),
-            "longitude": Decimal(str(round(lon + lon_variation, 6))),
+            "latitude": round(lat + lat_variation, 6),
+            "longitude": round(lon + lon_variation, 6),
             "speed": Decimal(str(max(0, round(speed + speed_variation, 2)))),
             "course": Decimal(str(round((course + course_variation) % 360, 2))),
             "heading": (heading + int(course_variation)) % 360,
@@ -315,11 +315,11 @@ async def insert_sample_vessels(session: AsyncSession) -> list[Vessel]:
     for i, vessel_data in enumerate(SAMPLE_VESSELS):
         # Set initial position from base positions
         base_pos = BASE_POSITIONS[i % len(BASE_POSITIONS)]
-        vessel_data["last_latitude"] = Decimal(str(base_pos["lat"]))
-        vessel_data["last_longitude"] = Decimal(str(base_pos["lon"]))
+        vessel_data["last_latitude"] = base_pos["lat"]
+        vessel_data["last_longitude"] = base_pos["lon"]
         vessel_data["last_speed"] = Decimal(str(base_pos["speed"]))
         vessel_data["last_course"] = Decimal(str(random.randint(0, 359)))
-        vessel_data["last_position_time"] = datetime.utcnow()
+        vessel_data["last_position_time"] = datetime.now(timezone.utc)
 
         vessel = Vessel(**vessel_data)
         session.add(vessel)
@@ -359,12 +359,11 @@ async def insert_sample_positions(session: AsyncSession, vessels: list[Vessel])
         )
 
         for pos_data in positions_data:
+            lat = pos_data.pop("latitude")
+            lon = pos_data.pop("longitude")
             position = VesselPosition(
                 mmsi=vessel.mmsi,
-                position=WKTElement(
-                    f"SRID=4326;POINT({pos_data['longitude']} {pos_data['latitude']})",
-                    srid=4326,
-                ),
+                position=WKTElement(f"SRID=4326;POINT({lon} {lat})", srid=4326),
                 **pos_data,
             )
             session.add(position)
@@ -399,10 +398,10 @@ async def insert_sample_alerts(session: AsyncSession) -> None:
             "status": "active",
             "title": "Vessel entered port area",
             "message": "AEGEAN SPIRIT (239876543) has entered the Thessaloniki Port main area",
-            "vessel_mmsi": "239876543",
+            "vessel_mmsi": 239876543,
             "zone_id": zone_id,
-            "latitude": Decimal("40.6400"),
-            "longitude": Decimal("22.9300"),
+            "latitude": 40.6400,
+            "longitude": 22.9300,
             "details": {
                 "zone_name": "Port of Thessaloniki - Main Port Area",
                 "vessel_speed": 5.2,
@@ -416,10 +415,10 @@ async def insert_sample_alerts(session: AsyncSession) -> None:
             "status": "active",
             "title": "Speed limit exceeded",
             "message": "PACIFIC DAWN (371234000) exceeding speed limit in port area",
-            "vessel_mmsi": "371234000",
+            "vessel_mmsi": 371234000,
             "zone_id": zone_id,
-            "latitude": Decimal("40.6350"),
-            "longitude": Decimal("22.9280"),
+            "latitude": 40.6350,
+            "longitude": 22.9280,
             "details": {
                 "speed_limit": 8.0,
                 "current_speed": 11.5,
@@ -433,16 +432,16 @@ async def insert_sample_alerts(session: AsyncSession) -> None:
             "status": "acknowledged",
             "title": "AIS signal gap detected",
             "message": "CARIBBEAN TRADER (311045000) - No AIS signal for 45 minutes",
-            "vessel_mmsi": "311045000",
-            "latitude": Decimal("40.6100"),
-            "longitude": Decimal("22.9500"),
+            "vessel_mmsi": 311045000,
+            "latitude": 40.6100,
+            "longitude": 22.9500,
             "details": {
                 "gap_duration_minutes": 45,
                 "last_known_speed": 8.0,
                 "last_known_course": 180.0,
             },
             "acknowledged": True,
-            "acknowledged_at": datetime.utcnow() - timedelta(hours=1),
+            "acknowledged_at": datetime.now(timezone.utc) - timedelta(hours=1),
             "acknowledged_by": "operator@poseidon.gr",
         },
     ]
@@ -454,8 +453,6 @@ async def insert_sample_alerts(session: AsyncSession) -> None:
         alert = RiskAlert(
             **alert_data,
             position=WKTElement(f"SRID=4326;POINT({lon} {lat})", srid=4326),
-            latitude=lat,
-            longitude=lon,
         )
         session.add(alert)
         logger.info(f"  - Added alert: {alert.title}")
@@ -0,0 +1,48 @@
+"""Helpers for Alembic data migrations.
+
+Import from revision modules only; this pulls in alembic's operation proxies,
+which the application itself never needs.
+"""
+
+from typing import Any, Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.util import await_only
+
+
+def copy_seed(table: sa.Table, rows: Sequence[dict[str, Any]]) -> None:
+    """Seed rows into a table from within a migration.
+
+    Online, rows are streamed with COPY through the asyncpg connection the
+    migration runs on (same transaction). In offline (--sql) mode they fall
+    back to op.bulk_insert so the generated script stays plain SQL.
+
+    COPY uses asyncpg's binary codecs, so every seeded column must have a
+    type asyncpg can encode natively (no PostGIS columns).
+
+    Args:
+        table: Target table (e.g. from sa.table() or a model's __table__)
+        rows: Row dictionaries, all with the same keys
+    """
+    if not rows:
+        return
+
+    if context.is_offline_mode():
+        op.bulk_insert(table, list(rows))
+        return
+
+    columns = list(rows[0])
+    records = [tuple(row[column] for column in columns) for row in rows]
+
+    # Migrations run inside AsyncConnection.run_sync(), so the driver's
+    # coroutine can be awaited from this synchronous call
+    driver_connection = op.get_bind().connection.driver_connection
+    await_only(
+        driver_connection.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=columns,
+            records=records,
+        )
+    )
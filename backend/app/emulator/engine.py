@@ -6,7 +6,7 @@ The main orchestrator for the AIS traffic simulation.
 import asyncio
 import logging
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from app.ais.models import AISMessage, BoundingBox, VesselType
@@ -48,7 +48,7 @@ class TrafficEmulator:
         """Get seconds elapsed since start."""
         if self._start_time is None:
             return 0.0
-        return (datetime.utcnow() - self._start_time).total_seconds()
+        return (datetime.now(timezone.utc) - self._start_time).total_seconds()
 
     @property
     def transmitting_vessels(self) -> list[EmulatedVessel]:
@@ -164,7 +164,7 @@ class TrafficEmulator:
         )
 
         self.is_running = True
-        self._start_time = datetime.utcnow()
+        self._start_time = datetime.now(timezone.utc)
         self._last_update_time = self._start_time
         self._update_count = 0
 
@@ -220,7 +220,7 @@ class TrafficEmulator:
 
     async def update_positions(self) -> None:
         """Calculate and update positions for all vessels."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         time_delta = timedelta(seconds=self.update_interval)
 
         # Use actual time delta if available
@@ -251,6 +251,8 @@ class TrafficEmulator:
             List of AISMessage objects
         """
         messages = []
+        # One clock read for the whole snapshot
+        now = datetime.now(timezone.utc)
 
         for vessel in self.vessels:
             # Skip non-transmitting vessels unless requested
@@ -261,7 +263,7 @@ class TrafficEmulator:
             if bbox and not bbox.contains(vessel.latitude, vessel.longitude):
                 continue
 
-            messages.append(vessel.to_ais_message())
+            messages.append(vessel.to_ais_message(now))
 
         return messages
 
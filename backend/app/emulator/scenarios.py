@@ -3,15 +3,26 @@
 Handles loading YAML scenario files and validating their structure.
 """
 
+import copy
 import logging
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Number of parsed scenario files kept in memory
+SCENARIO_CACHE_SIZE = 32
+
 
 class ScenarioLoadError(Exception):
     """Exception raised when loading a scenario fails."""
@@ -209,6 +220,31 @@ def validate_scenario(data: dict[str, Any]) -> None:
             )
 
 
+@lru_cache(maxsize=SCENARIO_CACHE_SIZE)
+def _parse_scenario_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a scenario YAML file.
+
+    mtime_ns and size are only part of the cache key, so an edited file is
+    parsed again. The result is shared; callers must not mutate it.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _read_scenario_file(filepath: Path) -> Any:
+    """Return the parsed contents of a scenario file, cached while unchanged."""
+    # One stat per lookup; abspath is string-only, unlike resolve() which
+    # lstat()s every path component
+    path = os.path.abspath(filepath)
+    stat = os.stat(path)
+    return _parse_scenario_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_scenario_cache() -> None:
+    """Drop all cached scenario file contents."""
+    _parse_scenario_file.cache_clear()
+
+
 def load_scenario(filepath: str | Path) -> Scenario:
     """Load scenario from YAML file.
 
@@ -233,8 +269,8 @@ def load_scenario(filepath: str | Path) -> Scenario:
         )
 
     try:
-        with open(filepath, "r") as f:
-            data = yaml.safe_load(f)
+        # Each Scenario gets its own copy of the cached data
+        data = copy.deepcopy(_read_scenario_file(filepath))
     except yaml.YAMLError as e:
         raise ScenarioLoadError(f"Failed to parse YAML: {e}")
 
@@ -281,6 +317,48 @@ def load_scenario(filepath: str | Path) -> Scenario:
     return scenario
 
 
+# Project root (poseidon-mss directory); scenarios.py is at
+# backend/app/emulator/scenarios.py
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@lru_cache(maxsize=1)
+def get_scenarios_dir() -> Path:
+    """Get the scenarios directory, checking multiple possible locations.
+
+    The result is cached for the life of the process; call
+    invalidate_scenarios_dir() after the directory layout changes.
+
+    Returns:
+        Path to scenarios directory
+    """
+    # os.path.isdir() is a single stat per candidate
+    # Check Docker path first (when mounted at /app/scenarios)
+    if os.path.isdir("/app/scenarios"):
+        logger.debug("Using Docker scenarios path: /app/scenarios")
+        return Path("/app/scenarios")
+
+    # Check relative path from working directory
+    if os.path.isdir("scenarios"):
+        logger.debug(f"Using relative scenarios path: {os.path.abspath('scenarios')}")
+        return Path("scenarios")
+
+    # Check relative to the project root (for local development)
+    local_path = PROJECT_ROOT / "scenarios"
+    if os.path.isdir(local_path):
+        logger.debug(f"Using local development scenarios path: {local_path}")
+        return local_path
+
+    # Default to relative path (may not exist)
+    logger.warning(f"Scenarios directory not found. Checked: /app/scenarios, scenarios, {local_path}")
+    return Path("scenarios")
+
+
+def invalidate_scenarios_dir() -> None:
+    """Forget the cached scenarios directory so the next call probes again."""
+    get_scenarios_dir.cache_clear()
+
+
 def list_scenarios(scenarios_dir: str | Path = "scenarios") -> list[str]:
     """List available scenario files.
 
@@ -316,8 +394,7 @@ def get_scenario_info(filepath: str | Path) -> dict[str, Any]:
     filepath = Path(filepath)
 
     try:
-        with open(filepath, "r") as f:
-            data = yaml.safe_load(f)
+        data = _read_scenario_file(filepath)
 
         return {
             "name": data.get("name", filepath.stem),
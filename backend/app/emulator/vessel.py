@@ -5,7 +5,7 @@ Represents a simulated vessel with movement behaviors and AIS message generation
 
 import random
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from app.ais.models import AISMessage, NavigationStatus, VesselType
@@ -81,6 +81,14 @@ class EmulatedVessel:
             flag_state: Flag state (country code)
             ais_gap_config: Configuration for simulating AIS gaps
         """
+        # Validated once here so every AIS message of this vessel can skip it
+        if not (100000000 <= mmsi <= 999999999):
+            raise ValueError(f"Invalid MMSI: {mmsi}")
+        if not (-90 <= position.latitude <= 90 and -180 <= position.longitude <= 180):
+            raise ValueError(
+                f"Invalid position: {position.latitude}, {position.longitude}"
+            )
+
         self.mmsi = mmsi
         self.name = name
         self.vessel_type = vessel_type
@@ -102,7 +110,7 @@ class EmulatedVessel:
         self._behavior = behavior
 
         # Timing
-        self._start_time = datetime.utcnow()
+        self._start_time = datetime.now(timezone.utc)
         self._last_update_time = self._start_time
         self._elapsed_seconds = 0.0
 
@@ -165,7 +173,7 @@ class EmulatedVessel:
         """
         # Update elapsed time
         self._elapsed_seconds += time_delta.total_seconds()
-        self._last_update_time = datetime.utcnow()
+        self._last_update_time = datetime.now(timezone.utc)
 
         # Check AIS gap
         self._update_ais_gap_status()
@@ -192,24 +200,33 @@ class EmulatedVessel:
         else:
             self._is_transmitting = True
 
-    def to_ais_message(self) -> AISMessage:
+    def to_ais_message(self, now: Optional[datetime] = None) -> AISMessage:
         """Convert current state to AIS message.
 
+        Args:
+            now: Report and reception time (UTC); taken from the clock if
+                not given. Pass one value to stamp a whole snapshot
+
         Returns:
             AISMessage representing current vessel state
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         # Add slight noise to position for realism
         lat_noise = random.uniform(-0.00001, 0.00001)
         lon_noise = random.uniform(-0.00001, 0.00001)
 
+        # MMSI and start position are checked in __init__ and dead reckoning
+        # keeps vessels in range, so only the cheap normalizations remain
         return AISMessage(
             mmsi=self.mmsi,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             latitude=self.latitude + lat_noise,
             longitude=self.longitude + lon_noise,
-            speed_over_ground=round(self.speed, 1),
-            course_over_ground=round(self.course, 1),
-            heading=int(self.heading),
+            speed_over_ground=max(0.0, min(102.2, round(self.speed, 1))),
+            course_over_ground=round(self.course, 1) % 360,
+            heading=int(self.heading) % 360,
             navigation_status=self.navigation_status,
             vessel_name=self.name,
             vessel_type=self.vessel_type,
@@ -222,6 +239,8 @@ class EmulatedVessel:
             position_accuracy="H",  # Emulated data is "high accuracy"
             source="emulator",
             source_quality=1.0,
+            received_at=now,
+            _validate=False,
         )
 
     @classmethod
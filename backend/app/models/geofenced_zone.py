@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID, uuid4
 
-from geoalchemy2 import Geography
+from geoalchemy2 import Geometry
 from sqlalchemy import Boolean, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -25,6 +25,12 @@ class GeofencedZone(Base, TimestampMixin):
         Index("ix_zones_zone_type", "zone_type"),
         Index("ix_zones_security_level", "security_level"),
         Index("ix_zones_active", "active"),
+        Index(
+            "ix_zones_alert_config_gin",
+            "alert_config",
+            postgresql_using="gin",
+            postgresql_ops={"alert_config": "jsonb_path_ops"},
+        ),
         {"schema": "security"},
     )
 
@@ -53,9 +59,9 @@ class GeofencedZone(Base, TimestampMixin):
     # Security level (1-5, higher = more secure/sensitive)
     security_level: Mapped[int] = mapped_column(Integer, default=1)
 
-    # PostGIS geography polygon (SRID 4326 - WGS84)
+    # PostGIS geometry polygon (SRID 4326 - WGS84)
     geometry: Mapped[bytes] = mapped_column(
-        Geography(geometry_type="POLYGON", srid=4326),
+        Geometry(geometry_type="POLYGON", srid=4326, spatial_index=False),
         nullable=False,
     )
 
@@ -1,14 +1,14 @@
 """RiskAlert model for security alerts and risk events."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID, uuid4
 
-from geoalchemy2 import Geography
-from sqlalchemy import Boolean, ForeignKey, Index, Numeric, String, Text
+from geoalchemy2 import Geometry
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database.base import Base
@@ -19,6 +19,21 @@ if TYPE_CHECKING:
     from app.models.vessel import Vessel
 
 
+# Display text per alert type; other types are title-cased
+_ALERT_TYPE_TEXT = {
+    "zone_entry": "Zone Entry",
+    "zone_exit": "Zone Exit",
+    "speed_violation": "Speed Violation",
+    "ais_gap": "AIS Signal Gap",
+    "dark_vessel": "Dark Vessel Detected",
+    "collision_risk": "Collision Risk",
+    "suspicious_behavior": "Suspicious Behavior",
+    "anchor_dragging": "Anchor Dragging",
+    "route_deviation": "Route Deviation",
+    "port_approach": "Port Approach",
+}
+
+
 class RiskAlert(Base):
     """Risk alert model for security events and notifications."""
 
@@ -28,8 +43,21 @@ class RiskAlert(Base):
         Index("ix_alerts_severity", "severity"),
         Index("ix_alerts_status", "status"),
         Index("ix_alerts_vessel_mmsi", "vessel_mmsi"),
-        Index("ix_alerts_created_at", "created_at", postgresql_using="btree"),
+        # Serves GET /alerts: created_at window, optional filters, newest first
+        Index(
+            "ix_alerts_created_status_severity_type",
+            text("created_at DESC"),
+            "status",
+            "severity",
+            "alert_type",
+        ),
         Index("ix_alerts_position", "position", postgresql_using="gist"),
+        Index(
+            "ix_alerts_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
         {"schema": "security"},
     )
 
@@ -68,15 +96,15 @@ class RiskAlert(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Primary vessel involved
-    vessel_mmsi: Mapped[Optional[str]] = mapped_column(
-        String(9),
+    vessel_mmsi: Mapped[Optional[int]] = mapped_column(
+        Integer,
         ForeignKey("ais.vessels.mmsi", ondelete="SET NULL"),
         nullable=True,
     )
 
     # Secondary vessel (for collision risks, etc.)
-    secondary_vessel_mmsi: Mapped[Optional[str]] = mapped_column(
-        String(9),
+    secondary_vessel_mmsi: Mapped[Optional[int]] = mapped_column(
+        Integer,
         ForeignKey("ais.vessels.mmsi", ondelete="SET NULL"),
         nullable=True,
     )
@@ -88,13 +116,14 @@ class RiskAlert(Base):
         nullable=True,
     )
 
-    # Position where alert occurred (PostGIS geography point)
+    # Position where alert occurred (PostGIS geometry point)
     position: Mapped[Optional[bytes]] = mapped_column(
-        Geography(geometry_type="POINT", srid=4326),
+        Geometry(geometry_type="POINT", srid=4326, spatial_index=False),
         nullable=True,
     )
-    latitude: Mapped[Optional[Decimal]] = mapped_column(Numeric(9, 6), nullable=True)
-    longitude: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 6), nullable=True)
+    # Coordinates derived from the point on load; not stored separately
+    latitude: Mapped[Optional[float]] = column_property(func.ST_Y(position))
+    longitude: Mapped[Optional[float]] = column_property(func.ST_X(position))
 
     # Alert details (JSONB for flexible storage)
     details: Mapped[Optional[dict[str, Any]]] = mapped_column(
@@ -182,45 +211,39 @@ class RiskAlert(Base):
     @property
     def alert_type_text(self) -> str:
         """Return human-readable alert type."""
-        types = {
-            "zone_entry": "Zone Entry",
-            "zone_exit": "Zone Exit",
-            "speed_violation": "Speed Violation",
-            "ais_gap": "AIS Signal Gap",
-            "dark_vessel": "Dark Vessel Detected",
-            "collision_risk": "Collision Risk",
-            "suspicious_behavior": "Suspicious Behavior",
-            "anchor_dragging": "Anchor Dragging",
-            "route_deviation": "Route Deviation",
-            "port_approach": "Port Approach",
-        }
-        return types.get(self.alert_type, self.alert_type.replace("_", " ").title())
+        return self.type_text(self.alert_type)
+
+    @staticmethod
+    def type_text(alert_type: str) -> str:
+        """Return the human-readable text for an alert type string."""
+        text = _ALERT_TYPE_TEXT.get(alert_type)
+        return text if text is not None else alert_type.replace("_", " ").title()
 
     def acknowledge(self, user: str, notes: Optional[str] = None) -> None:
         """Mark the alert as acknowledged."""
         self.acknowledged = True
-        self.acknowledged_at = datetime.utcnow()
+        self.acknowledged_at = datetime.now(timezone.utc)
         self.acknowledged_by = user
         self.acknowledgment_notes = notes
         self.status = "acknowledged"
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     def resolve(self, user: str, notes: Optional[str] = None) -> None:
         """Mark the alert as resolved."""
         self.resolved = True
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = datetime.now(timezone.utc)
         self.resolved_by = user
         self.resolution_notes = notes
         self.status = "resolved"
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     def dismiss(self, user: str, notes: Optional[str] = None) -> None:
         """Dismiss the alert."""
         self.status = "dismissed"
         self.resolution_notes = notes
         self.resolved_by = user
-        self.resolved_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.resolved_at = datetime.now(timezone.utc)
+        self.updated_at = datetime.now(timezone.utc)
 
     def escalate(self, notes: Optional[str] = None) -> None:
         """Escalate the alert."""
@@ -228,4 +251,4 @@ class RiskAlert(Base):
         if notes:
             self.details = self.details or {}
             self.details["escalation_notes"] = notes
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
@@ -20,6 +20,12 @@ class SystemConfig(Base, TimestampMixin):
         Index("ix_system_config_key", "key", unique=True),
         Index("ix_system_config_category", "category"),
         Index("ix_system_config_active", "active"),
+        Index(
+            "ix_system_config_value_gin",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "jsonb_path_ops"},
+        ),
         {"schema": "security"},
     )
 
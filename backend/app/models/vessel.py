@@ -1,10 +1,10 @@
 """Vessel model for AIS vessel data."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Index, Integer, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Float, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -20,15 +20,21 @@ class Vessel(Base, TimestampMixin):
 
     __tablename__ = "vessels"
     __table_args__ = (
-        Index("ix_vessels_name", "name"),
+        Index(
+            "ix_vessels_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
         Index("ix_vessels_ship_type", "ship_type"),
         Index("ix_vessels_flag_state", "flag_state"),
         Index("ix_vessels_risk_score", "risk_score"),
+        CheckConstraint("mmsi BETWEEN 100000000 AND 999999999", name="mmsi_range"),
         {"schema": "ais"},
     )
 
     # Primary key - Maritime Mobile Service Identity (9 digits)
-    mmsi: Mapped[str] = mapped_column(String(9), primary_key=True)
+    mmsi: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
 
     # IMO number (optional, 7 digits)
     imo: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
@@ -68,11 +74,11 @@ class Vessel(Base, TimestampMixin):
     risk_category: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Last known position data (denormalized for quick access)
-    last_latitude: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(9, 6), nullable=True
+    last_latitude: Mapped[Optional[float]] = mapped_column(
+        Float(precision=53), nullable=True
     )
-    last_longitude: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 6), nullable=True
+    last_longitude: Mapped[Optional[float]] = mapped_column(
+        Float(precision=53), nullable=True
     )
     last_speed: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(5, 2), nullable=True
@@ -108,8 +114,8 @@ class Vessel(Base, TimestampMixin):
 
     def update_last_position(
         self,
-        latitude: Decimal,
-        longitude: Decimal,
+        latitude: float,
+        longitude: float,
         speed: Optional[Decimal] = None,
         course: Optional[Decimal] = None,
         timestamp: Optional[datetime] = None,
@@ -119,4 +125,4 @@ class Vessel(Base, TimestampMixin):
         self.last_longitude = longitude
         self.last_speed = speed
         self.last_course = course
-        self.last_position_time = timestamp or datetime.utcnow()
+        self.last_position_time = timestamp or datetime.now(timezone.utc)
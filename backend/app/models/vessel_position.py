@@ -4,9 +4,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from geoalchemy2 import Geography
-from sqlalchemy import BigInteger, ForeignKey, Index, Integer, Numeric, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from geoalchemy2 import Geometry
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, Numeric
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database.base import Base
@@ -20,39 +20,44 @@ class VesselPosition(Base):
 
     __tablename__ = "vessel_positions"
     __table_args__ = (
-        Index("ix_vessel_positions_mmsi_timestamp", "mmsi", "timestamp", postgresql_using="btree"),
-        Index("ix_vessel_positions_timestamp", "timestamp", postgresql_using="btree"),
+        Index(
+            "ix_vessel_positions_timestamp",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
         Index(
             "ix_vessel_positions_position",
             "position",
             postgresql_using="gist",
         ),
-        {"schema": "ais"},
+        {"schema": "ais", "postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     # Composite primary key for time-series partitioning
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     # Foreign key to vessel
-    mmsi: Mapped[str] = mapped_column(
-        String(9),
+    mmsi: Mapped[int] = mapped_column(
+        Integer,
         ForeignKey("ais.vessels.mmsi", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
 
-    # Position timestamp from AIS message
-    timestamp: Mapped[datetime] = mapped_column(nullable=False)
+    # Position timestamp from AIS message (partition key)
+    timestamp: Mapped[datetime] = mapped_column(primary_key=True)
 
-    # PostGIS geography point (SRID 4326 - WGS84)
+    # PostGIS geometry point (SRID 4326 - WGS84). Planar operators keep bbox
+    # filtering cheap; cast to geography where geodesic distance is needed.
     position: Mapped[bytes] = mapped_column(
-        Geography(geometry_type="POINT", srid=4326),
+        Geometry(geometry_type="POINT", srid=4326, spatial_index=False),
         nullable=False,
     )
 
-    # Coordinates stored separately for easy access without PostGIS functions
-    latitude: Mapped[Decimal] = mapped_column(Numeric(9, 6), nullable=False)
-    longitude: Mapped[Decimal] = mapped_column(Numeric(10, 6), nullable=False)
+    # Coordinates derived from the point on load; not stored separately
+    latitude: Mapped[float] = column_property(func.ST_Y(position))
+    longitude: Mapped[float] = column_property(func.ST_X(position))
 
     # Speed Over Ground (knots, 0-102.2)
     speed: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
@@ -111,3 +116,13 @@ class VesselPosition(Base):
             15: "Not defined",
         }
         return status_map.get(status, "Unknown") if status is not None else "Unknown"
+
+
+# Covering index for "latest positions of a vessel": newest first, with the
+# coordinates and motion columns included so the query is served index-only
+Index(
+    "ix_vessel_positions_mmsi_timestamp",
+    VesselPosition.mmsi,
+    VesselPosition.timestamp.desc(),
+    postgresql_include=["position", "speed", "course"],
+)
@@ -5,6 +5,7 @@ from app.socketio.server import (
     init_socketio_server,
     emit_vessel_update,
     emit_alert,
+    emit_alert_batch,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "init_socketio_server",
     "emit_vessel_update",
     "emit_alert",
+    "emit_alert_batch",
 ]
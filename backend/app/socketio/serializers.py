@@ -63,7 +63,7 @@ def serialize_alert(alert: RiskAlert) -> dict[str, Any]:
         "id": str(alert.id),
         "type": alert.alert_type,
         "severity": alert.severity,
-        "vessel_mmsi": alert.vessel_mmsi,
+        "vessel_mmsi": str(alert.vessel_mmsi) if alert.vessel_mmsi else None,
         "message": alert.message,
         "timestamp": alert.created_at.isoformat() if alert.created_at else datetime.utcnow().isoformat(),
         "acknowledged": alert.acknowledged,
@@ -85,3 +85,20 @@ async def emit_alert(alert_data: dict[str, Any]) -> None:
         logger.info(f"Emitted alert:new for alert {alert_data.get('id')}")
     except Exception as e:
         logger.warning(f"Failed to emit alert:new: {e}")
+
+
+async def emit_alert_batch(alerts_data: list[dict[str, Any]]) -> None:
+    """Emit several new alerts to all connected clients in one event.
+
+    Args:
+        alerts_data: Alert data dictionaries matching frontend Alert type,
+            most important first
+    """
+    if not alerts_data:
+        return
+
+    try:
+        await sio.emit("alert:batch", alerts_data)
+        logger.info(f"Emitted alert:batch with {len(alerts_data)} alerts")
+    except Exception as e:
+        logger.warning(f"Failed to emit alert:batch: {e}")
@@ -9,7 +9,7 @@ Provides:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from celery import shared_task
@@ -18,7 +18,6 @@ from sqlalchemy import text
 
 from app.ais import BoundingBox, get_ais_manager, AISDataFetchError
 from app.ais.processor import process_ais_messages, update_all_risk_scores
-from app.cache import get_redis_client
 from app.celery_app import run_async, is_worker_initialized
 from app.database.connection import get_async_session
 
@@ -183,8 +182,8 @@ async def _fetch_and_process_impl(
         stats = await process_ais_messages(session, messages)
         await session.commit()
 
-    # Cache positions in Redis (batch operation)
-    cached = await _cache_positions_batch(messages)
+    # Positions are cached in Redis by the processor in one pipeline
+    cached = stats["positions_cached"]
 
     elapsed = (datetime.utcnow() - start_time).total_seconds()
 
@@ -207,34 +206,6 @@ async def _fetch_and_process_impl(
     }
 
 
-async def _cache_positions_batch(messages) -> int:
-    """Cache vessel positions in Redis.
-
-    Args:
-        messages: List of AIS messages
-
-    Returns:
-        Number of positions cached
-    """
-    redis_client = get_redis_client()
-    if not redis_client or not redis_client.is_connected:
-        return 0
-
-    positions = []
-    for msg in messages:
-        positions.append({
-            "mmsi": msg.mmsi,
-            "latitude": msg.latitude,
-            "longitude": msg.longitude,
-            "speed": msg.speed_over_ground,
-            "course": msg.course_over_ground,
-            "heading": msg.heading,
-            "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
-        })
-
-    return await redis_client.set_vessel_positions_batch(positions)
-
-
 # ==================== Risk Score Update Task ====================
 
 @shared_task(
@@ -439,7 +410,7 @@ async def _cleanup_impl(days_to_keep: int, task_id: str) -> dict[str, Any]:
     Returns:
         Cleanup statistics dictionary
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
     start_time = datetime.utcnow()
 
     async with get_async_session() as session:
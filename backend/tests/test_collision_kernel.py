@@ -0,0 +1,206 @@
+"""Tests for the array collision kernel.
+
+The kernel (scan_pairs/classify_pairs, via find_collision_risks) must report
+the same pairs, risk levels and ordering as assess_collision_risk() applied
+to every pair.
+
+Run with: python -m pytest tests/test_collision_kernel.py -v
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ais import _collision_kernel
+from app.ais._collision_kernel import classify_pairs, scan_pairs, search_radius_nm
+from app.ais.collision_detection import (
+    DEFAULT_CPA_THRESHOLD_NM,
+    DEFAULT_MIN_SPEED_KNOTS,
+    DEFAULT_TCPA_THRESHOLD_MIN,
+    RISK_LEVELS,
+    VesselState,
+    VesselStateBatch,
+    assess_collision_risk,
+    calculate_cpa_tcpa,
+    find_collision_risks,
+)
+
+CPA = DEFAULT_CPA_THRESHOLD_NM
+TCPA = DEFAULT_TCPA_THRESHOLD_MIN
+
+
+def random_fleet(count: int, seed: int) -> list[tuple]:
+    """(mmsi, name, lat, lon, speed, course) rows packed into Thermaikos Gulf."""
+    rng = random.Random(seed)
+    return [
+        (
+            237000000 + i,
+            f"VESSEL {i}",
+            rng.uniform(40.50, 40.60),
+            rng.uniform(22.80, 22.98),
+            # Some vessels fall under the minimum speed
+            rng.uniform(0.0, 20.0),
+            rng.uniform(0.0, 360.0),
+        )
+        for i in range(count)
+    ]
+
+
+def reference_risks(rows: list[tuple]) -> list[tuple]:
+    """Risks from assess_collision_risk() on every pair, in kernel order."""
+    states = [VesselState(*row) for row in rows]
+    risks = []
+    for a in range(len(states)):
+        for b in range(a + 1, len(states)):
+            risk = assess_collision_risk(states[a], states[b], CPA, TCPA)
+            if risk is not None:
+                # Order on the unrounded TCPA, as the kernel does
+                _, tcpa, _ = calculate_cpa_tcpa(states[a], states[b])
+                risks.append((RISK_LEVELS.index(risk.risk_level), tcpa, risk))
+    # Critical first, then soonest TCPA
+    risks.sort(key=lambda entry: entry[:2])
+    return [_key(risk) for _, _, risk in risks]
+
+
+def kernel_risks(rows: list[tuple]) -> list[tuple]:
+    """Risks from the array kernel."""
+    return [_key(r) for r in find_collision_risks(VesselStateBatch.from_rows(rows), CPA, TCPA)]
+
+
+def _key(risk) -> tuple:
+    return (
+        risk.vessel1_mmsi,
+        risk.vessel2_mmsi,
+        risk.risk_level,
+        risk.cpa,
+        risk.tcpa,
+        risk.current_distance,
+    )
+
+
+def assert_same_risks(rows: list[tuple]) -> None:
+    expected = reference_risks(rows)
+    actual = kernel_risks(rows)
+
+    assert [k[:3] for k in actual] == [k[:3] for k in expected]
+    for got, want in zip(actual, expected):
+        # Outputs are rounded, and the kernel's mean-of-cosines differs from
+        # the cosine of the mean latitude by O(dlat^2), so allow one step of
+        # the last rounded digit
+        assert got[3] == pytest.approx(want[3], abs=1.5e-3)
+        assert got[4] == pytest.approx(want[4], abs=0.15)
+        assert got[5] == pytest.approx(want[5], abs=1.5e-3)
+
+
+def _cos_deg(lat: float) -> float:
+    return math.cos(math.radians(lat))
+
+
+def head_on_pair(separation_nm: float, lateral_nm: float = 0.0) -> list[tuple]:
+    """Two 10-knot vessels on reciprocal north/south courses."""
+    lat = 40.55
+    lon = 22.90
+    cos_lat = _cos_deg(lat)
+    return [
+        (237000001, "SOUTHBOUND", lat + separation_nm / 60.0, lon, 10.0, 180.0),
+        (237000002, "NORTHBOUND", lat, lon + lateral_nm / (60.0 * cos_lat), 10.0, 0.0),
+    ]
+
+
+class TestKernelMatchesPairwise:
+    """Random fleets checked against the per-pair implementation."""
+
+    @pytest.mark.parametrize("count", [40, 2 * _collision_kernel.BLOCK_ROWS + 17])
+    def test_random_fleet(self, count: int) -> None:
+        rows = random_fleet(count, seed=count)
+        assert reference_risks(rows), "fleet should produce some risks"
+        assert_same_risks(rows)
+
+    def test_small_blocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Many blocks, including a partial last one."""
+        monkeypatch.setattr(_collision_kernel, "BLOCK_ROWS", 7)
+        assert_same_risks(random_fleet(60, seed=7))
+
+    def test_fewer_than_two_vessels(self) -> None:
+        assert kernel_risks([]) == []
+        assert kernel_risks(random_fleet(1, seed=1)) == []
+
+
+class TestEdgeCases:
+    """Pairs on the boundaries of the kernel's filters."""
+
+    def test_at_search_radius(self) -> None:
+        radius = search_radius_nm(10.0, CPA, TCPA)
+        # Exactly at the radius the pair cannot reach CPA within the window
+        rows = head_on_pair(radius)
+        assert reference_risks(rows) == []
+        assert_same_risks(rows)
+
+    def test_just_inside_search_radius(self) -> None:
+        # Offset laterally just under 2 * CPA, meeting just before the window
+        # ends: the farthest pair that is still reported
+        along = 20.0 * (TCPA - 0.05) / 60
+        rows = head_on_pair(along, lateral_nm=2 * CPA - 0.01)
+        assert [k[2] for k in reference_risks(rows)] == ["low"]
+        assert_same_risks(rows)
+
+    def test_parallel_tracks(self) -> None:
+        # Same speed and course: zero relative velocity, never a risk
+        rows = [
+            (237000001, "A", 40.550, 22.90, 12.0, 45.0),
+            (237000002, "B", 40.551, 22.90, 12.0, 45.0),
+        ]
+        assert reference_risks(rows) == []
+        assert_same_risks(rows)
+
+    def test_below_min_speed(self) -> None:
+        # Head-on and close, but one vessel is under the minimum speed
+        rows = head_on_pair(0.5)
+        rows[1] = rows[1][:4] + (DEFAULT_MIN_SPEED_KNOTS / 2, 0.0)
+        assert reference_risks(rows) == []
+        assert_same_risks(rows)
+
+    def test_level_before_tcpa(self) -> None:
+        # A medium pair meeting in 3 minutes, listed first, and a critical
+        # pair meeting in 9: the critical one is reported first
+        lat = 40.45
+        rows = [
+            (237000003, "EASTBOUND", lat, 22.80, 10.0, 90.0),
+            (237000004, "WESTBOUND", lat + 0.6 / 60.0, 22.80 + 1.0 / (60.0 * _cos_deg(lat)),
+             10.0, 270.0),
+        ] + head_on_pair(3.0)
+        levels = [k[2] for k in kernel_risks(rows)]
+        assert levels == ["critical", "medium"]
+        assert_same_risks(rows)
+
+
+def test_classify_pairs_matches_bands() -> None:
+    """classify_pairs() uses the classify_risk_level() bands."""
+    from app.ais.collision_detection import classify_risk_level
+
+    rng = random.Random(3)
+    cpa = np.array([rng.uniform(0.0, 1.2) for _ in range(500)])
+    tcpa = np.array([rng.uniform(0.0, 30.0) for _ in range(500)])
+    labels = classify_pairs(cpa, tcpa, CPA)
+
+    for c, t, label in zip(cpa.tolist(), tcpa.tolist(), labels.tolist()):
+        level = classify_risk_level(c, t, CPA)
+        assert label == (RISK_LEVELS.index(level) if level else len(RISK_LEVELS))
+
+
+def test_scan_pairs_orders_indices() -> None:
+    """Every reported pair has i < j in the caller's order."""
+    batch = VesselStateBatch.from_rows(random_fleet(100, seed=5))
+    i_idx, j_idx, _, _, _ = scan_pairs(
+        batch.latitude, batch.longitude, batch.speed, batch.vx, batch.vy,
+        CPA, TCPA, DEFAULT_MIN_SPEED_KNOTS,
+    )
+    assert len(i_idx)
+    assert (i_idx < j_idx).all()
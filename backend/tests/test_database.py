@@ -191,8 +191,8 @@ class TestSpatialQueries:
                     WHERE v.last_latitude IS NOT NULL
                       AND v.last_longitude IS NOT NULL
                       AND ST_Within(
-                          ST_SetSRID(ST_MakePoint(v.last_longitude, v.last_latitude), 4326)::geography::geometry,
-                          z.geometry::geometry
+                          ST_SetSRID(ST_MakePoint(v.last_longitude, v.last_latitude), 4326),
+                          z.geometry
                       )
                     LIMIT 10
                 """)
@@ -213,15 +213,15 @@ class TestSpatialQueries:
 
             result = await session.execute(
                 text("""
-                    SELECT v.name, vp.latitude, vp.longitude, vp.speed, vp.timestamp,
+                    SELECT v.name, ST_Y(vp.position), ST_X(vp.position), vp.speed, vp.timestamp,
                            ST_Distance(
-                               vp.position,
+                               vp.position::geography,
                                ST_SetSRID(ST_MakePoint(:lon, :lat), 4326)::geography
                            ) as distance_m
                     FROM ais.vessel_positions vp
                     JOIN ais.vessels v ON v.mmsi = vp.mmsi
                     WHERE ST_DWithin(
-                        vp.position,
+                        vp.position::geography,
                         ST_SetSRID(ST_MakePoint(:lon, :lat), 4326)::geography,
                         :radius
                     )
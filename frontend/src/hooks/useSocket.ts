@@ -5,7 +5,7 @@ import type { Vessel, Alert } from '@/types';
 
 export function useSocket() {
   const socketRef = useRef<Socket | null>(null);
-  const { updateVessel, addAlert, setConnected } = useVesselStore();
+  const { updateVessel, addAlert, addAlerts, setConnected } = useVesselStore();
 
   useEffect(() => {
     // Connect directly to backend for WebSocket
@@ -45,10 +45,15 @@ export function useSocket() {
       addAlert(alert);
     });
 
+    socket.on('alert:batch', (alerts: Alert[]) => {
+      console.log('Received alert:batch', alerts.length);
+      addAlerts(alerts);
+    });
+
     return () => {
       socket.disconnect();
     };
-  }, [updateVessel, addAlert, setConnected]);
+  }, [updateVessel, addAlert, addAlerts, setConnected]);
 
   return socketRef.current;
 }
@@ -12,6 +12,7 @@ interface VesselState {
   updateVessel: (vessel: Vessel) => void;
   selectVessel: (mmsi: string | null) => void;
   addAlert: (alert: Alert) => void;
+  addAlerts: (alerts: Alert[]) => void;
   acknowledgeAlert: (alertId: string) => void;
   setConnected: (connected: boolean) => void;
 }
@@ -41,6 +42,11 @@ export const useVesselStore = create<VesselState>((set) => ({
       alerts: [alert, ...state.alerts].slice(0, 100),
     })),
 
+  addAlerts: (alerts) =>
+    set((state) => ({
+      alerts: [...alerts, ...state.alerts].slice(0, 100),
+    })),
+
   acknowledgeAlert: (alertId) =>
     set((state) => ({
       alerts: state.alerts.map((a) =>